@@ -2,10 +2,11 @@ import re
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.database import get_db
 from app.models import User
 from app.services.family_service import FamilyService
@@ -15,27 +16,41 @@ from app.utils.signed_urls import verify_signature
 
 router = APIRouter(prefix="/images", tags=["Images"])
 
+settings = get_settings()
+
 FILENAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+\.(jpg|jpeg|png|webp)$")
+UUID_PATTERN = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+# Keyed by the extension captured by FILENAME_PATTERN
+CONTENT_TYPES = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+}
 
 
 @router.get("/{user_id}/{filename}")
 async def get_image(
+    request: Request,
     user_id: str,
     filename: str,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User | None, Depends(get_current_user_optional)] = None,
     expires: str | None = Query(None),
     sig: str | None = Query(None),
-) -> FileResponse:
-    try:
-        UUID(user_id)
-    except ValueError as e:
+) -> Response:
+    if not UUID_PATTERN.fullmatch(user_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid user ID format",
-        ) from e
+        )
+    # Parsed once here; the pattern guarantees this cannot raise
+    owner_id = UUID(user_id)
 
-    if not FILENAME_PATTERN.match(filename):
+    filename_match = FILENAME_PATTERN.fullmatch(filename)
+    if not filename_match:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid filename format",
@@ -55,8 +70,7 @@ async def get_image(
             family_service = FamilyService(db)
             family = await family_service.get_by_id(current_user.family_id)
             if family:
-                family_user_ids = [str(m.id) for m in family.members]
-                can_access = user_id in family_user_ids
+                can_access = any(m.id == owner_id for m in family.members)
 
     if not can_access:
         raise HTTPException(
@@ -67,31 +81,40 @@ async def get_image(
     image_service = ImageService()
     image_path = image_service.get_image_path(path)
 
-    if not image_path.resolve().is_relative_to(image_service.storage_path.resolve()):
+    if not image_path.resolve().is_relative_to(image_service.resolved_storage_path):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid path",
         )
 
-    if not image_path.exists():
+    try:
+        stat_result = image_path.stat()
+    except OSError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Image not found",
-        )
+        ) from e
+
+    content_type = CONTENT_TYPES[filename_match.group(1)]
 
-    ext = filename.rsplit(".", 1)[-1].lower()
-    content_types = {
-        "jpg": "image/jpeg",
-        "jpeg": "image/jpeg",
-        "png": "image/png",
-        "webp": "image/webp",
+    etag = f'W/"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    headers = {
+        "Cache-Control": "private, max-age=3600, must-revalidate",
+        "ETag": etag,
     }
-    content_type = content_types.get(ext, "image/jpeg")
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if settings.internal_file_prefix:
+        # Let the reverse proxy serve the file bytes directly
+        headers["X-Accel-Redirect"] = f"{settings.internal_file_prefix.rstrip('/')}/{path}"
+        return Response(media_type=content_type, headers=headers)
 
     return FileResponse(
         path=str(image_path),
         media_type=content_type,
-        headers={
-            "Cache-Control": "private, max-age=3600, must-revalidate",
-        },
+        headers=headers,
+        stat_result=stat_result,
     )
@@ -686,7 +686,7 @@ async def get_item_history(
                         if oi.item.thumbnail_path
                         else None,
                     }
-                    for oi in sorted(h.outfit.items, key=lambda x: x.position)
+                    for oi in h.outfit.items
                 ],
             }
         entries.append(entry)
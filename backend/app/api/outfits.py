@@ -239,7 +239,7 @@ def outfit_to_response(
     outfit: Outfit, wore_instead_items_map: dict[str, list["WoreInsteadItem"]] | None = None
 ) -> OutfitResponse:
     items = []
-    for outfit_item in sorted(outfit.items, key=lambda x: x.position):
+    for outfit_item in outfit.items:
         item = outfit_item.item
         items.append(
             OutfitItemResponse(
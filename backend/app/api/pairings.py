@@ -5,7 +5,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field, computed_field
-from sqlalchemy import and_, select
+from sqlalchemy import and_, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -124,11 +124,12 @@ class GeneratePairingsResponse(BaseModel):
 
 
 def pairing_to_response(outfit: Outfit) -> PairingResponse:
+    # Values come straight from ORM rows, so skip validation with model_construct
     items = []
-    for outfit_item in sorted(outfit.items, key=lambda x: x.position):
+    for outfit_item in outfit.items:
         item = outfit_item.item
         items.append(
-            PairingItemResponse(
+            PairingItemResponse.model_construct(
                 id=item.id,
                 type=item.type,
                 subtype=item.subtype,
@@ -145,7 +146,7 @@ def pairing_to_response(outfit: Outfit) -> PairingResponse:
     # Build source item response
     source_item_response = None
     if outfit.source_item:
-        source_item_response = SourceItemResponse(
+        source_item_response = SourceItemResponse.model_construct(
             id=outfit.source_item.id,
             type=outfit.source_item.type,
             subtype=outfit.source_item.subtype,
@@ -158,7 +159,7 @@ def pairing_to_response(outfit: Outfit) -> PairingResponse:
     # Build feedback summary
     feedback_summary = None
     if outfit.feedback:
-        feedback_summary = FeedbackSummary(
+        feedback_summary = FeedbackSummary.model_construct(
             rating=outfit.feedback.rating,
             comment=outfit.feedback.comment,
             worn_at=outfit.feedback.worn_at,
@@ -176,7 +177,7 @@ def pairing_to_response(outfit: Outfit) -> PairingResponse:
     family_rating_count = None
     if hasattr(outfit, "family_ratings") and outfit.family_ratings:
         family_ratings_list = [
-            FamilyRatingResponse(
+            FamilyRatingResponse.model_construct(
                 id=r.id,
                 user_id=r.user_id,
                 user_display_name=r.user.display_name or r.user.email if r.user else "Unknown",
@@ -193,7 +194,7 @@ def pairing_to_response(outfit: Outfit) -> PairingResponse:
                 sum(r.rating for r in outfit.family_ratings) / family_rating_count
             )
 
-    return PairingResponse(
+    return PairingResponse.model_construct(
         id=outfit.id,
         occasion=outfit.occasion,
         scheduled_for=outfit.scheduled_for,
@@ -306,22 +307,21 @@ async def delete_pairing(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> None:
-    query = select(Outfit).where(
-        and_(
-            Outfit.id == pairing_id,
-            Outfit.user_id == current_user.id,
-            Outfit.source == OutfitSource.pairing,
+    # Child rows (items, feedback, ratings) are removed by ON DELETE CASCADE
+    result = await db.execute(
+        delete(Outfit).where(
+            and_(
+                Outfit.id == pairing_id,
+                Outfit.user_id == current_user.id,
+                Outfit.source == OutfitSource.pairing,
+            )
         )
     )
 
-    result = await db.execute(query)
-    pairing = result.scalar_one_or_none()
-
-    if not pairing:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Pairing not found",
         )
 
-    await db.delete(pairing)
     await db.commit()
@@ -88,7 +88,10 @@ class Outfit(Base):
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="outfits")
     items: Mapped[list["OutfitItem"]] = relationship(
-        "OutfitItem", back_populates="outfit", cascade="all, delete-orphan"
+        "OutfitItem",
+        back_populates="outfit",
+        cascade="all, delete-orphan",
+        order_by="OutfitItem.position",
     )
     feedback: Mapped[Optional["UserFeedback"]] = relationship(
         "UserFeedback", back_populates="outfit", uselist=False, cascade="all, delete-orphan"
@@ -2,9 +2,9 @@ from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 
-from app.utils.signed_urls import sign_image_url
+from app.utils.signed_urls import sign_image_url, url_expiry
 
 # Default wash intervals by clothing type (wears between washes)
 DEFAULT_WASH_INTERVALS: dict[str, int] = {
@@ -28,6 +28,18 @@ DEFAULT_WASH_INTERVALS: dict[str, int] = {
 }
 
 
+def _sign_image_paths(model: "ItemResponse | ItemImageResponse") -> None:
+    # Already populated when a dumped response is validated again
+    if model.image_url:
+        return
+    expires = url_expiry()
+    model.image_url = sign_image_url(model.image_path, expires=expires)
+    if model.thumbnail_path:
+        model.thumbnail_url = sign_image_url(model.thumbnail_path, expires=expires)
+    if model.medium_path:
+        model.medium_url = sign_image_url(model.medium_path, expires=expires)
+
+
 class ItemTags(BaseModel):
     colors: list[str] = Field(default_factory=list)
     primary_color: str | None = None
@@ -37,6 +49,10 @@ class ItemTags(BaseModel):
     season: list[str] = Field(default_factory=list)
     formality: str | None = None
     fit: str | None = None
+    occasion: list[str] | None = None
+    brand: str | None = None
+    condition: str | None = None
+    features: list[str] | None = None
 
 
 class ItemBase(BaseModel):
@@ -79,14 +95,9 @@ class ItemResponse(ItemBase):
     image_path: str
     thumbnail_path: str | None = None
     medium_path: str | None = None
-    tags: dict = Field(default_factory=dict)
+    tags: ItemTags = Field(default_factory=ItemTags)
     colors: list[str] = Field(default_factory=list)
     primary_color: str | None = None
-    pattern: str | None = None
-    material: str | None = None
-    style: list[str] = Field(default_factory=list)
-    formality: str | None = None
-    season: list[str] = Field(default_factory=list)
     status: str
     ai_processed: bool = False
     ai_confidence: Decimal | None = None
@@ -106,25 +117,15 @@ class ItemResponse(ItemBase):
     archive_reason: str | None = None
     created_at: datetime
     updated_at: datetime
+    # Signed from the paths above on construction, sharing one expiry
+    image_url: str = ""
+    thumbnail_url: str | None = None
+    medium_url: str | None = None
 
-    @computed_field
-    @property
-    def image_url(self) -> str:
-        return sign_image_url(self.image_path)
-
-    @computed_field
-    @property
-    def thumbnail_url(self) -> str | None:
-        if self.thumbnail_path:
-            return sign_image_url(self.thumbnail_path)
-        return None
-
-    @computed_field
-    @property
-    def medium_url(self) -> str | None:
-        if self.medium_path:
-            return sign_image_url(self.medium_path)
-        return None
+    @model_validator(mode="after")
+    def _sign_urls(self):
+        _sign_image_paths(self)
+        return self
 
     @computed_field
     @property
@@ -239,25 +240,14 @@ class ItemImageResponse(BaseModel):
     medium_path: str | None = None
     position: int
     created_at: datetime
-
-    @computed_field
-    @property
-    def image_url(self) -> str:
-        return sign_image_url(self.image_path)
-
-    @computed_field
-    @property
-    def thumbnail_url(self) -> str | None:
-        if self.thumbnail_path:
-            return sign_image_url(self.thumbnail_path)
-        return None
-
-    @computed_field
-    @property
-    def medium_url(self) -> str | None:
-        if self.medium_path:
-            return sign_image_url(self.medium_path)
-        return None
+    image_url: str = ""
+    thumbnail_url: str | None = None
+    medium_url: str | None = None
+
+    @model_validator(mode="after")
+    def _sign_urls(self):
+        _sign_image_paths(self)
+        return self
 
 
 class ReorderImagesRequest(BaseModel):
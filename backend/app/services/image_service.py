@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 
@@ -30,11 +31,21 @@ ALLOWED_MIME_TYPES = {
 }
 
 
+@lru_cache
+def _resolve_storage_path(storage_path: Path) -> Path:
+    return storage_path.resolve()
+
+
 class ImageService:
     def __init__(self, storage_path: str | None = None):
         self.storage_path = Path(storage_path or settings.storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def resolved_storage_path(self) -> Path:
+        """Storage root with symlinks resolved, computed once per process."""
+        return _resolve_storage_path(self.storage_path)
+
     def _get_user_path(self, user_id: uuid.UUID) -> Path:
         user_path = self.storage_path / str(user_id)
         user_path.mkdir(parents=True, exist_ok=True)
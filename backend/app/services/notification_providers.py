@@ -1,5 +1,7 @@
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 
 import httpx
@@ -9,6 +11,16 @@ from app.schemas.notification import EmailConfig, ExpoPushConfig, MattermostConf
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def _http_client(client: httpx.AsyncClient | None) -> AsyncIterator[httpx.AsyncClient]:
+    """Use the caller's shared client, or a one-off client when none was given."""
+    if client is not None:
+        yield client
+    else:
+        async with httpx.AsyncClient(timeout=30.0) as one_off:
+            yield one_off
+
+
 # ntfy Provider
 @dataclass
 class NtfyNotification:
@@ -23,10 +35,11 @@ class NtfyNotification:
 
 
 class NtfyProvider:
-    def __init__(self, config: NtfyConfig):
+    def __init__(self, config: NtfyConfig, client: httpx.AsyncClient | None = None):
         self.server = config.server.rstrip("/")
         self.topic = config.topic
         self.token = config.token
+        self.client = client
 
     async def send(self, notification: NtfyNotification) -> dict:
         headers = {
@@ -53,7 +66,7 @@ class NtfyProvider:
             headers["Actions"] = "; ".join(actions)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _http_client(self.client) as client:
                 response = await client.post(
                     f"{self.server}/{notification.topic or self.topic}",
                     headers=headers,
@@ -108,8 +121,9 @@ class MattermostMessage:
 
 
 class MattermostProvider:
-    def __init__(self, config: MattermostConfig):
+    def __init__(self, config: MattermostConfig, client: httpx.AsyncClient | None = None):
         self.webhook_url = config.webhook_url
+        self.client = client
 
     async def send(self, message: MattermostMessage) -> dict:
         payload = {
@@ -133,7 +147,7 @@ class MattermostProvider:
             ]
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _http_client(self.client) as client:
                 response = await client.post(self.webhook_url, json=payload)
 
                 if response.status_code == 200:
@@ -249,8 +263,9 @@ class ExpoPushMessage:
 
 
 class ExpoPushProvider:
-    def __init__(self, config: ExpoPushConfig):
+    def __init__(self, config: ExpoPushConfig, client: httpx.AsyncClient | None = None):
         self.push_token = config.push_token
+        self.client = client
 
     async def send(self, message: ExpoPushMessage) -> dict:
         payload = {
@@ -266,7 +281,7 @@ class ExpoPushProvider:
             payload["badge"] = message.badge
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _http_client(self.client) as client:
                 response = await client.post(
                     EXPO_PUSH_URL,
                     json=payload,
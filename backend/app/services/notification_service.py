@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from enum import StrEnum
 from uuid import UUID
 
+import httpx
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -158,9 +159,13 @@ class NotificationService:
 
 
 class NotificationDispatcher:
-    def __init__(self, db: AsyncSession, app_url: str):
+    def __init__(
+        self, db: AsyncSession, app_url: str, http_client: httpx.AsyncClient | None = None
+    ):
         self.db = db
         self.app_url = app_url.rstrip("/")
+        # Shared client keeps provider connections alive across jobs
+        self.http_client = http_client
 
     async def send_outfit_notification(
         self, user_id: UUID, outfit_id: UUID, for_tomorrow: bool = False
@@ -308,12 +313,14 @@ class NotificationDispatcher:
     ) -> NotificationResult:
         try:
             if channel_config.channel == "ntfy":
-                provider = NtfyProvider(NtfyConfig(**channel_config.config))
+                provider = NtfyProvider(NtfyConfig(**channel_config.config), self.http_client)
                 message = self._build_ntfy_notification(outfit, user, for_tomorrow)
                 result = await provider.send(message)
 
             elif channel_config.channel == "mattermost":
-                provider = MattermostProvider(MattermostConfig(**channel_config.config))
+                provider = MattermostProvider(
+                    MattermostConfig(**channel_config.config), self.http_client
+                )
                 message = self._build_mattermost_message(outfit, user, for_tomorrow)
                 result = await provider.send(message)
 
@@ -323,7 +330,9 @@ class NotificationDispatcher:
                 result = await provider.send(message)
 
             elif channel_config.channel == "expo_push":
-                provider = ExpoPushProvider(ExpoPushConfig(**channel_config.config))
+                provider = ExpoPushProvider(
+                    ExpoPushConfig(**channel_config.config), self.http_client
+                )
                 message = self._build_expo_push_message(outfit, user, for_tomorrow)
                 result = await provider.send(message)
 
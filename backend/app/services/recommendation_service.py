@@ -104,7 +104,7 @@ class RecommendationService:
     async def get_candidate_items(
         self,
         user: User,
-        weather: WeatherData,
+        weather: WeatherData | None,
         occasion: str,
         preferences: UserPreference | None,
         exclude_items: list[UUID],
@@ -142,6 +142,22 @@ class RecommendationService:
 
         return items
 
+    async def prefetch_wardrobe(
+        self, user: User, occasion: str, exclude_items: list[UUID] | None = None
+    ) -> list[ClothingItem]:
+        """Load candidate items ahead of generate_recommendation.
+
+        Candidates don't depend on the weather, so callers can run this
+        concurrently with a forecast lookup and pass the result back in.
+        """
+        return await self.get_candidate_items(
+            user=user,
+            weather=None,
+            occasion=occasion,
+            preferences=user.preferences,
+            exclude_items=exclude_items or [],
+        )
+
     def _filter_by_season(self, items: list[ClothingItem], user: User) -> list[ClothingItem]:
         user_today = get_user_today(user)
         current_season = MONTH_TO_SEASON[user_today.month]
@@ -535,6 +551,7 @@ class RecommendationService:
         exclude_items: list[UUID] | None = None,
         include_items: list[UUID] | None = None,
         source: OutfitSource = OutfitSource.on_demand,
+        candidates: list[ClothingItem] | None = None,
     ) -> Outfit:
         exclude_items = exclude_items or []
         include_items = include_items or []
@@ -564,14 +581,15 @@ class RecommendationService:
             ai_endpoints = preferences.ai_endpoints
         ai_service = AIService(endpoints=ai_endpoints)
 
-        # Get candidate items
-        candidates = await self.get_candidate_items(
-            user=user,
-            weather=weather,
-            occasion=occasion,
-            preferences=preferences,
-            exclude_items=exclude_items,
-        )
+        # Get candidate items, unless the caller prefetched them
+        if candidates is None:
+            candidates = await self.get_candidate_items(
+                user=user,
+                weather=weather,
+                occasion=occasion,
+                preferences=preferences,
+                exclude_items=exclude_items,
+            )
 
         # Force-include specific items if requested (fetch and add to candidates)
         if include_items:
@@ -1,39 +1,96 @@
+import asyncio
 import logging
+import random
+import time
+import uuid
 from contextlib import asynccontextmanager
 
 import redis.asyncio as aioredis
+from redis.commands.core import AsyncScript
 
 from app.config import get_settings
 
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent Redis connections per process; callers wait up to
+# REDIS_POOL_TIMEOUT seconds for a free connection instead of opening more.
+REDIS_MAX_CONNECTIONS = 32
+REDIS_POOL_TIMEOUT = 2
+
+# Bounds (seconds) for the jittered exponential backoff between acquire attempts
+LOCK_RETRY_BASE_DELAY = 0.01
+LOCK_RETRY_MAX_DELAY = 1.0
+
+# Compare-and-delete: only the holder's token may release the lock
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+else
+    return 0
+end
+"""
+
 _redis_pool: aioredis.Redis | None = None
+_release_lock: AsyncScript | None = None
 
 
 async def get_redis() -> aioredis.Redis:
-    global _redis_pool
+    global _redis_pool, _release_lock
     if _redis_pool is None:
-        settings = get_settings()
-        _redis_pool = aioredis.from_url(
+        pool = aioredis.BlockingConnectionPool.from_url(
             str(settings.redis_url),
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT,
             decode_responses=True,
         )
+        # from_pool hands the pool to the client, so aclose() also disconnects it
+        _redis_pool = aioredis.Redis.from_pool(pool)
+        _release_lock = _redis_pool.register_script(_RELEASE_SCRIPT)
     return _redis_pool
 
 
+async def warmup_redis() -> None:
+    """Open the first pooled connection up front so the first lock skips the handshake."""
+    try:
+        r = await get_redis()
+        await r.ping()
+    except (aioredis.RedisError, OSError) as e:
+        logger.warning("Redis warmup failed: %s", e)
+
+
+async def close_redis() -> None:
+    global _redis_pool, _release_lock
+    if _redis_pool is not None:
+        await _redis_pool.aclose()
+        _redis_pool = None
+        _release_lock = None
+
+
 @asynccontextmanager
-async def distributed_lock(key: str, timeout: int = 10, blocking_timeout: int = 5):
+async def distributed_lock(
+    key: str,
+    timeout: int = 10,
+    blocking_timeout: int = 5,
+    base_delay: float = LOCK_RETRY_BASE_DELAY,
+    max_delay: float = LOCK_RETRY_MAX_DELAY,
+):
     r = await get_redis()
-    lock = r.lock(key, timeout=timeout, blocking_timeout=blocking_timeout)
-    acquired = False
-    try:
-        acquired = await lock.acquire()
-        if not acquired:
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + blocking_timeout
+    attempt = 0
+
+    while not await r.set(key, token, nx=True, px=timeout * 1000):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
             raise TimeoutError(f"Could not acquire lock: {key}")
+        # Jitter keeps workers that collided on the same key from retrying in lockstep
+        delay = min(max_delay, base_delay * 2**attempt) * (0.5 + random.random() * 0.5)
+        await asyncio.sleep(min(delay, remaining))
+        attempt += 1
+
+    try:
         yield
     finally:
-        if acquired:
-            try:
-                await lock.release()
-            except aioredis.exceptions.LockNotOwnedError:
-                logger.warning("Lock %s already released (expired?)", key)
+        if not await _release_lock(keys=[key], args=[token]):
+            logger.warning("Lock %s already released (expired?)", key)
@@ -1,6 +1,5 @@
 """Signed URL utilities for secure image access."""
 
-import hashlib
 import hmac
 import time
 
@@ -9,26 +8,43 @@ from app.config import get_settings
 # Default expiry: 1 hour
 DEFAULT_EXPIRY_SECONDS = 3600
 
+# Signature length in bytes (32 hex chars in the URL)
+SIGNATURE_BYTES = 16
 
-def sign_image_url(path: str, expiry_seconds: int = DEFAULT_EXPIRY_SECONDS) -> str:
+settings = get_settings()
+
+# Encoded once; every signature is keyed with these bytes
+_SECRET = settings.secret_key.encode()
+
+
+def _signature(path: str, expires: int | str) -> bytes:
+    # Create signature: HMAC(secret, path + expires), truncated for shorter URLs
+    message = f"{path}:{expires}"
+    return hmac.digest(_SECRET, message.encode(), "sha256")[:SIGNATURE_BYTES]
+
+
+def url_expiry(expiry_seconds: int = DEFAULT_EXPIRY_SECONDS) -> int:
+    """Unix timestamp at which a URL signed now should expire."""
+    return time.time_ns() // 1_000_000_000 + expiry_seconds
+
+
+def sign_image_url(
+    path: str, expiry_seconds: int = DEFAULT_EXPIRY_SECONDS, expires: int | None = None
+) -> str:
     """
     Generate a signed URL for an image path.
 
     Args:
         path: The image path (e.g., "user_id/filename.jpg")
         expiry_seconds: How long the URL is valid (default 1 hour)
+        expires: Explicit expiry timestamp, to share one across several URLs
 
     Returns:
         Signed URL with signature and expiry parameters
     """
-    settings = get_settings()
-    expires = int(time.time()) + expiry_seconds
-
-    # Create signature: HMAC(secret, path + expires)
-    message = f"{path}:{expires}"
-    signature = hmac.new(
-        settings.secret_key.encode(), message.encode(), hashlib.sha256
-    ).hexdigest()[:32]  # Use first 32 chars for shorter URLs
+    if expires is None:
+        expires = url_expiry(expiry_seconds)
+    signature = _signature(path, expires).hex()
 
     return f"/api/v1/images/{path}?expires={expires}&sig={signature}"
 
@@ -45,7 +61,9 @@ def verify_signature(path: str, expires: str, signature: str) -> bool:
     Returns:
         True if signature is valid and not expired
     """
-    settings = get_settings()
+    # Reject malformed input before doing any HMAC work
+    if len(signature) != SIGNATURE_BYTES * 2 or not expires.isdigit():
+        return False
 
     # Check expiry
     try:
@@ -55,10 +73,7 @@ def verify_signature(path: str, expires: str, signature: str) -> bool:
     except (ValueError, TypeError):
         return False
 
-    # Verify signature
-    message = f"{path}:{expires}"
-    expected_signature = hmac.new(
-        settings.secret_key.encode(), message.encode(), hashlib.sha256
-    ).hexdigest()[:32]
-
-    return hmac.compare_digest(signature, expected_signature)
+    # Verify signature as the exact lowercase hex we issue; decoding it with
+    # bytes.fromhex would also accept case variants of a valid signature
+    expected_signature = _signature(path, expires).hex()
+    return hmac.compare_digest(signature.encode(), expected_signature.encode())
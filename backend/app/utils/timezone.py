@@ -1,21 +1,37 @@
 from datetime import UTC, date, datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from app.models import User
 
 
-def get_user_timezone(user: User) -> ZoneInfo:
+@lru_cache(maxsize=512)
+def _zone_info(name: str) -> ZoneInfo:
     try:
-        return ZoneInfo(user.timezone or "UTC")
+        return ZoneInfo(name)
     except Exception:
         return ZoneInfo("UTC")
 
 
+def get_user_timezone(user: User) -> ZoneInfo:
+    return _zone_info(user.timezone or "UTC")
+
+
+def now_in_tz(now_utc: datetime, user: User) -> datetime:
+    """Convert an already-captured UTC instant to the user's local time.
+
+    Lets callers iterating over many users read the clock once.
+    """
+    return now_utc.astimezone(get_user_timezone(user))
+
+
+def today_in_tz(now_utc: datetime, user: User) -> date:
+    return now_in_tz(now_utc, user).date()
+
+
 def get_user_today(user: User) -> date:
-    user_tz = get_user_timezone(user)
-    return datetime.now(UTC).astimezone(user_tz).date()
+    return today_in_tz(datetime.now(UTC), user)
 
 
 def get_user_now(user: User) -> datetime:
-    user_tz = get_user_timezone(user)
-    return datetime.now(UTC).astimezone(user_tz)
+    return now_in_tz(datetime.now(UTC), user)
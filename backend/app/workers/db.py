@@ -24,8 +24,10 @@ async def init_db(ctx: dict) -> None:
         str(settings.database_url),
         echo=settings.database_echo,
         pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=1800,
+        pool_timeout=10,
     )
     ctx["db_engine"] = engine
     ctx["db_session_factory"] = async_sessionmaker(
@@ -1,11 +1,20 @@
+import asyncio
 import logging
-import os
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
+import httpx
 from arq import cron
-from sqlalchemy import and_, select
-from sqlalchemy.orm import selectinload
-
+from arq.connections import ArqRedis
+from arq.constants import job_key_prefix, result_key_prefix
+from arq.jobs import serialize_job
+from arq.utils import timestamp_ms
+from redis.exceptions import RedisError
+from sqlalchemy import and_, func, insert, or_, select, update
+from sqlalchemy.orm import joinedload
+
+from app.config import get_settings
 from app.models.item import ClothingItem
 from app.models.learning import UserLearningProfile
 from app.models.notification import Notification, NotificationSettings, NotificationStatus
@@ -24,22 +33,47 @@ from app.services.notification_providers import (
 )
 from app.services.notification_service import DeliveryStatus, NotificationDispatcher
 from app.services.recommendation_service import RecommendationService
-from app.services.weather_service import get_weather_service
 from app.utils.redis_lock import distributed_lock
 from app.workers.db import get_db_session
 
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Concurrent retries, each holding a pooled connection for its whole send. The
+# worker runs up to max_jobs=5 jobs at once, so one job takes a fifth of the
+# steady-state pool and leaves the overflow for the others.
+RETRY_CONCURRENCY = max(1, settings.db_pool_size // 5)
+# Concurrent learning profile recomputes, each in its own session
+LEARNING_CONCURRENCY = 4
+# Concurrent wash reminder sends (HTTP only, no DB connection held)
+WASH_REMINDER_CONCURRENCY = 8
+# Lifetime of the per-minute cron leader keys; outlives the tick it guards
+CRON_TICK_TTL = 90
+
+
+async def _claim_cron_tick(ctx: dict, job: str, now_utc: datetime) -> bool:
+    """Let only the first worker run a cron body for a given minute.
+
+    Fails open: if Redis can't be reached the tick runs, and the per-job
+    dedup (``_job_id``, row locks) still applies.
+    """
+    key = f"cron:{job}:{now_utc.strftime('%Y%m%d%H%M')}"
+    try:
+        return bool(await ctx["redis"].set(key, "1", nx=True, ex=CRON_TICK_TTL))
+    except (RedisError, OSError) as e:
+        logger.warning(f"Cron leader check failed for {job}, running anyway: {e}")
+        return True
+
 
 async def reset_schedule_trigger(ctx: dict, schedule_id: str) -> None:
     try:
         db = get_db_session(ctx)
         try:
-            result = await db.execute(select(Schedule).where(Schedule.id == schedule_id))
-            sched = result.scalar_one_or_none()
-            if sched:
-                sched.last_triggered_at = None
-                await db.commit()
+            result = await db.execute(
+                update(Schedule).where(Schedule.id == schedule_id).values(last_triggered_at=None)
+            )
+            await db.commit()
+            if result.rowcount:
                 logger.info(
                     f"Reset last_triggered_at for schedule {schedule_id} after final retry failure"
                 )
@@ -54,8 +88,7 @@ async def send_notification(ctx: dict, user_id: str, outfit_id: str):
 
     db = get_db_session(ctx)
     try:
-        app_url = os.getenv("APP_URL", "http://localhost:3000")
-        dispatcher = NotificationDispatcher(db, app_url)
+        dispatcher = NotificationDispatcher(db, ctx["app_url"], ctx.get("http_client"))
 
         results = await dispatcher.send_outfit_notification(user_id=user_id, outfit_id=outfit_id)
 
@@ -78,74 +111,88 @@ async def send_notification(ctx: dict, user_id: str, outfit_id: str):
         await db.close()
 
 
+async def _retry_notification(
+    ctx: dict, notification_id: UUID, semaphore: asyncio.Semaphore
+) -> bool:
+    """Retry one notification in its own session; returns True if it was sent."""
+    async with semaphore:
+        db = get_db_session(ctx)
+        notification = None
+        try:
+            # Non-blocking lock: skip if another worker already retrying this one
+            async with distributed_lock(
+                f"notif-retry:{notification_id}", timeout=30, blocking_timeout=0
+            ):
+                # Claim the attempt only if the row is still retrying; the
+                # RETURNING row replaces a separate re-read
+                result = await db.execute(
+                    update(Notification)
+                    .where(
+                        Notification.id == notification_id,
+                        Notification.status == NotificationStatus.retrying,
+                    )
+                    .values(
+                        attempts=Notification.attempts + 1,
+                        last_attempt_at=datetime.now(UTC),
+                    )
+                    .returning(Notification)
+                    .execution_options(populate_existing=True)
+                )
+                notification = result.scalar_one_or_none()
+                if notification is None:
+                    return False
+
+                dispatcher = NotificationDispatcher(db, ctx["app_url"], ctx.get("http_client"))
+                result = await dispatcher.retry_notification(notification)
+
+                sent = result.status == DeliveryStatus.SENT
+                if sent:
+                    notification.status = NotificationStatus.sent
+                    notification.sent_at = datetime.now(UTC)
+                elif notification.attempts >= notification.max_attempts:
+                    notification.status = NotificationStatus.failed
+                    notification.error_message = result.error or "Max retries exceeded"
+                else:
+                    notification.error_message = result.error
+
+                await db.commit()
+                return sent
+
+        except TimeoutError:
+            logger.debug(
+                "Skipping notification %s retry — another worker holds the lock",
+                notification_id,
+            )
+            return False
+        except Exception as e:
+            logger.exception(f"Failed to retry notification {notification_id}: {e}")
+            if notification is not None and notification.attempts >= notification.max_attempts:
+                notification.status = NotificationStatus.failed
+                notification.error_message = str(e)
+                await db.commit()
+            return False
+        finally:
+            await db.close()
+
+
 async def retry_failed_notifications(ctx: dict):
     logger.info("Checking for notifications to retry...")
 
+    if not await _claim_cron_tick(ctx, "retry_failed_notifications", datetime.now(UTC)):
+        return {"retried": 0, "skipped": "not_leader"}
+
     db = get_db_session(ctx)
     try:
         # Get notifications in retrying status
         result = await db.execute(
-            select(Notification).where(
+            select(Notification.id).where(
                 and_(
                     Notification.status == NotificationStatus.retrying,
                     Notification.attempts < Notification.max_attempts,
                 )
             )
         )
-        notifications = list(result.scalars().all())
-
-        if not notifications:
-            logger.info("No notifications to retry")
-            return {"retried": 0}
-
-        retried = 0
-        app_url = os.getenv("APP_URL", "http://localhost:3000")
-        dispatcher = NotificationDispatcher(db, app_url)
-
-        for notification in notifications:
-            # Non-blocking lock: skip if another worker already retrying this one
-            try:
-                async with distributed_lock(
-                    f"notif-retry:{notification.id}", timeout=30, blocking_timeout=0
-                ):
-                    # Re-read inside lock to check if status changed
-                    await db.refresh(notification)
-                    if notification.status != NotificationStatus.retrying:
-                        continue
-
-                    notification.attempts += 1
-                    notification.last_attempt_at = datetime.now(UTC)
-
-                    result = await dispatcher.retry_notification(notification)
-
-                    if result.status == DeliveryStatus.SENT:
-                        notification.status = NotificationStatus.sent
-                        notification.sent_at = datetime.now(UTC)
-                        retried += 1
-                    elif notification.attempts >= notification.max_attempts:
-                        notification.status = NotificationStatus.failed
-                        notification.error_message = result.error or "Max retries exceeded"
-                    else:
-                        notification.error_message = result.error
-
-                    await db.commit()
-
-            except TimeoutError:
-                logger.debug(
-                    "Skipping notification %s retry — another worker holds the lock",
-                    notification.id,
-                )
-                continue
-            except Exception as e:
-                logger.exception(f"Failed to retry notification {notification.id}: {e}")
-                if notification.attempts >= notification.max_attempts:
-                    notification.status = NotificationStatus.failed
-                    notification.error_message = str(e)
-                    await db.commit()
-
-        logger.info(f"Retried {retried} notifications")
-        return {"retried": retried}
-
+        notification_ids = list(result.scalars().all())
     except Exception as e:
         logger.exception("Error in retry_failed_notifications")
         await db.rollback()
@@ -153,66 +200,98 @@ async def retry_failed_notifications(ctx: dict):
     finally:
         await db.close()
 
+    if not notification_ids:
+        logger.info("No notifications to retry")
+        return {"retried": 0}
+
+    semaphore = asyncio.Semaphore(RETRY_CONCURRENCY)
+    outcomes = await asyncio.gather(
+        *(
+            _retry_notification(ctx, notification_id, semaphore)
+            for notification_id in notification_ids
+        ),
+        return_exceptions=True,
+    )
+    for notification_id, outcome in zip(notification_ids, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            logger.error(f"Retry task for notification {notification_id} failed: {outcome}")
+    retried = sum(1 for outcome in outcomes if outcome is True)
+
+    logger.info(f"Retried {retried} notifications")
+    return {"retried": retried}
+
 
 async def process_scheduled_notification(ctx: dict, schedule_id: str):
     logger.info(f"Processing scheduled notification for schedule {schedule_id}")
 
     db = get_db_session(ctx)
     try:
-        result = await db.execute(select(Schedule).where(Schedule.id == schedule_id))
-        schedule = result.scalar_one_or_none()
-        if not schedule:
+        # Schedule, active user with preferences, and enabled channel count in
+        # one round-trip. The count is a scalar subquery so the joined
+        # preferences row doesn't need to be part of a GROUP BY.
+        channel_count = (
+            select(func.count(NotificationSettings.id))
+            .where(
+                and_(
+                    NotificationSettings.user_id == Schedule.user_id,
+                    # "= true", not "IS TRUE": only equality matches the partial index
+                    NotificationSettings.enabled == True,  # noqa: E712
+                )
+            )
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            select(Schedule, User, channel_count.label("n_channels"))
+            .outerjoin(User, and_(User.id == Schedule.user_id, User.is_active.is_(True)))
+            .options(joinedload(User.preferences))
+            .where(Schedule.id == schedule_id)
+        )
+        row = result.one_or_none()
+        if not row:
             logger.warning(f"Schedule {schedule_id} not found, skipping")
             return {"status": "skipped", "reason": "not_found"}
 
-        user_result = await db.execute(
-            select(User)
-            .options(selectinload(User.preferences))
-            .where(User.id == schedule.user_id, User.is_active.is_(True))
-        )
-        user = user_result.scalar_one_or_none()
+        schedule, user, n_channels = row
         if not user:
             logger.warning(f"User {schedule.user_id} not found or deleted, skipping")
             return {"status": "skipped", "reason": "user_not_found"}
 
-        channels_result = await db.execute(
-            select(NotificationSettings).where(
-                and_(
-                    NotificationSettings.user_id == schedule.user_id,
-                    NotificationSettings.enabled == True,  # noqa: E712
-                )
-            )
-        )
-        if not channels_result.scalars().first():
+        if n_channels == 0:
             logger.warning(f"No enabled channels for user {schedule.user_id}, skipping")
             return {"status": "skipped", "reason": "no_channels"}
 
         is_for_tomorrow = schedule.notify_day_before
         weather_override = None
+        candidates = None
+        recommendation_service = RecommendationService(db)
 
         if is_for_tomorrow and user.location_lat and user.location_lon:
-            try:
-                weather_service = get_weather_service()
-                weather_override = await weather_service.get_tomorrow_weather(
-                    user.location_lat, user.location_lon
-                )
+            # The forecast is HTTP-only, so load the wardrobe while it's in flight
+            forecast, candidates = await asyncio.gather(
+                ctx["weather_service"].get_tomorrow_weather(user.location_lat, user.location_lon),
+                recommendation_service.prefetch_wardrobe(user, schedule.occasion),
+                return_exceptions=True,
+            )
+            if isinstance(candidates, BaseException):
+                raise candidates
+            if isinstance(forecast, BaseException):
+                logger.warning(f"Failed to fetch tomorrow's weather: {forecast}")
+            else:
+                weather_override = forecast
                 logger.info(
                     f"Fetched tomorrow's forecast for user {user.id}: "
                     f"{weather_override.temperature}°C, {weather_override.condition}"
                 )
-            except Exception as e:
-                logger.warning(f"Failed to fetch tomorrow's weather: {e}")
 
-        recommendation_service = RecommendationService(db)
         outfit = await recommendation_service.generate_recommendation(
             user=user,
             occasion=schedule.occasion,
             source=OutfitSource.scheduled,
             weather_override=weather_override,
+            candidates=candidates,
         )
 
-        app_url = os.getenv("APP_URL", "http://localhost:3000")
-        dispatcher = NotificationDispatcher(db, app_url)
+        dispatcher = NotificationDispatcher(db, ctx["app_url"], ctx.get("http_client"))
         await dispatcher.send_outfit_notification(
             user_id=str(user.id),
             outfit_id=str(outfit.id),
@@ -240,16 +319,82 @@ async def process_scheduled_notification(ctx: dict, schedule_id: str):
         await db.close()
 
 
+# Same check-and-write arq's enqueue_job does under WATCH/MULTI, as one script
+# so a batch of jobs can share a single pipeline round-trip.
+# KEYS: job key, result key, queue. ARGV: job id, score, expiry ms, job body.
+_ENQUEUE_SCRIPT = """
+if redis.call('exists', KEYS[1], KEYS[2]) > 0 then
+    return 0
+end
+redis.call('psetex', KEYS[1], ARGV[3], ARGV[4])
+redis.call('zadd', KEYS[3], ARGV[2], ARGV[1])
+return 1
+"""
+
+
+async def enqueue_jobs_bulk(
+    redis: ArqRedis,
+    function: str,
+    jobs: list[tuple[str, tuple]],
+    *,
+    queue_name: str,
+) -> list[bool | Exception]:
+    """Enqueue ``(job_id, args)`` pairs for *function* in one Redis round-trip.
+
+    Jobs are stored exactly as ``ArqRedis.enqueue_job`` stores them. Returns one
+    entry per job: True if enqueued, False if a job with that id already
+    exists, or the exception Redis returned for it.
+    """
+    enqueue_time_ms = timestamp_ms()
+    async with redis.pipeline(transaction=False) as pipe:
+        for job_id, args in jobs:
+            body = serialize_job(
+                function, args, {}, None, enqueue_time_ms, serializer=redis.job_serializer
+            )
+            # Plain EVAL rather than a registered Script: a pipeline holding
+            # Script calls issues SCRIPT EXISTS before every execute, which
+            # would double the round-trips. Redis caches the compiled body.
+            pipe.eval(
+                _ENQUEUE_SCRIPT,
+                3,
+                job_key_prefix + job_id,
+                result_key_prefix + job_id,
+                queue_name,
+                job_id,
+                enqueue_time_ms,
+                redis.expires_extra_ms,
+                body,
+            )
+        results = await pipe.execute(raise_on_error=False)
+    return [r if isinstance(r, Exception) else bool(r) for r in results]
+
+
 async def check_scheduled_notifications(ctx: dict):
     logger.info("Checking scheduled notifications...")
 
+    now_utc = datetime.now(UTC)
+    if not await _claim_cron_tick(ctx, "check_scheduled_notifications", now_utc):
+        return {"checked": 0, "enqueued": 0, "skipped": "not_leader"}
+
     db = get_db_session(ctx)
     try:
-        now_utc = datetime.now(UTC)
         current_utc_day = now_utc.weekday()
-        current_utc_time = now_utc.time()
         tomorrow_utc_day = (current_utc_day + 1) % 7
 
+        # Deduplication: skip if triggered within the last hour
+        threshold = now_utc - timedelta(hours=1)
+
+        # Due window is the previous, current and next minute as a plain range on
+        # notification_time. It is clamped to today rather than wrapped, since the
+        # day_of_week match below is for today's date.
+        minute_start = now_utc.replace(second=0, microsecond=0)
+        day_start = minute_start.replace(hour=0, minute=0)
+        window_start = max(minute_start - timedelta(minutes=1), day_start)
+        window_end = minute_start + timedelta(minutes=2)
+        in_window = Schedule.notification_time >= window_start.time()
+        if window_end.date() == minute_start.date():
+            in_window = and_(in_window, Schedule.notification_time < window_end.time())
+
         result = await db.execute(
             select(Schedule).where(
                 and_(
@@ -264,73 +409,89 @@ async def check_scheduled_notifications(ctx: dict):
                             & (Schedule.day_of_week == tomorrow_utc_day)
                         )
                     ),
+                    in_window,
+                    or_(
+                        Schedule.last_triggered_at.is_(None),
+                        Schedule.last_triggered_at < threshold,
+                    ),
                 )
             )
         )
-        schedules = list(result.scalars().all())
-
-        to_enqueue: list[Schedule] = []
-        for schedule in schedules:
-            schedule_minutes = (
-                schedule.notification_time.hour * 60 + schedule.notification_time.minute
-            )
-            current_minutes = current_utc_time.hour * 60 + current_utc_time.minute
-
-            if abs(schedule_minutes - current_minutes) > 1:
-                continue
-
-            # Deduplication: skip if triggered within the last hour
-            threshold = now_utc - timedelta(hours=1)
-            if schedule.last_triggered_at and schedule.last_triggered_at >= threshold:
-                logger.debug(
-                    f"Skipping schedule {schedule.id} - triggered recently at "
-                    f"{schedule.last_triggered_at}"
+        due = list(result.scalars().all())
+
+        # Mark all due schedules as triggered NOW in one statement, and commit
+        # before enqueuing to prevent duplicate enqueues on the next cron tick.
+        # The dedup check is repeated in the UPDATE so a row another worker
+        # marked since our SELECT is not claimed twice; RETURNING says which won.
+        claimed: set[UUID] = set()
+        if due:
+            result = await db.execute(
+                update(Schedule)
+                .where(
+                    Schedule.id.in_([schedule.id for schedule in due]),
+                    or_(
+                        Schedule.last_triggered_at.is_(None),
+                        Schedule.last_triggered_at < threshold,
+                    ),
                 )
-                continue
-
-            # Mark as triggered NOW to prevent duplicate enqueues on next cron tick
-            schedule.last_triggered_at = now_utc
-            to_enqueue.append(schedule)
+                .values(last_triggered_at=now_utc)
+                .returning(Schedule.id)
+            )
+            claimed = set(result.scalars().all())
+            await db.commit()
 
+        to_enqueue = [schedule for schedule in due if schedule.id in claimed]
+        for schedule in to_enqueue:
             logger.info(
                 f"Enqueuing notification job for schedule {schedule.id} "
                 f"(user={schedule.user_id}, occasion={schedule.occasion})"
             )
 
-        # Commit all last_triggered_at updates before enqueuing
-        if to_enqueue:
-            await db.commit()
-
-        # Enqueue jobs after commit so dedup is persisted even if enqueue fails.
-        # _job_id ensures idempotent enqueue: if multiple workers run the cron
-        # concurrently, only the first enqueue for each schedule/minute wins.
-        # arq silently ignores enqueue_job when a job with the same _job_id exists.
-        minute_key = now_utc.strftime("%Y%m%d%H%M")
-        enqueue_failures = 0
-        for schedule in to_enqueue:
-            try:
-                await ctx["redis"].enqueue_job(
-                    "process_scheduled_notification",
-                    str(schedule.id),
-                    _queue_name="arq:tagging",
-                    _job_id=f"sched:{schedule.id}:{minute_key}",
-                )
-            except Exception as e:
-                enqueue_failures += 1
-                logger.error(f"Failed to enqueue job for schedule {schedule.id}: {e}")
-
-        if enqueue_failures:
-            logger.warning(f"{enqueue_failures}/{len(to_enqueue)} jobs failed to enqueue")
-
-        logger.info(f"Checked {len(schedules)} schedules, enqueued {len(to_enqueue)} jobs")
-        return {"checked": len(schedules), "enqueued": len(to_enqueue)}
+        schedule_ids = [schedule.id for schedule in to_enqueue]
 
     except Exception as e:
         logger.exception("Error in check_scheduled_notifications")
         return {"error": str(e)}
     finally:
+        # Release the pooled connection before the Redis round-trips below
         await db.close()
 
+    # Enqueue jobs after commit so dedup is persisted even if enqueue fails.
+    # The job id makes enqueue idempotent: if multiple workers run the cron
+    # concurrently, only the first enqueue for each schedule/minute wins.
+    minute_key = now_utc.strftime("%Y%m%d%H%M")
+    enqueued = 0
+    dedup_skipped = 0
+    enqueue_failures = 0
+    if schedule_ids:
+        try:
+            outcomes = await enqueue_jobs_bulk(
+                ctx["redis"],
+                "process_scheduled_notification",
+                [
+                    (f"sched:{schedule_id}:{minute_key}", (str(schedule_id),))
+                    for schedule_id in schedule_ids
+                ],
+                queue_name="arq:tagging",
+            )
+        except Exception as e:
+            outcomes = [e] * len(schedule_ids)
+        for schedule_id, outcome in zip(schedule_ids, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                enqueue_failures += 1
+                logger.error(f"Failed to enqueue job for schedule {schedule_id}: {outcome}")
+            elif outcome:
+                enqueued += 1
+            else:
+                # Another poller already queued this schedule for this minute
+                dedup_skipped += 1
+
+    if enqueue_failures:
+        logger.warning(f"{enqueue_failures}/{len(schedule_ids)} jobs failed to enqueue")
+
+    logger.info(f"Enqueued {enqueued} jobs for due schedules ({dedup_skipped} already queued)")
+    return {"checked": len(due), "enqueued": enqueued, "dedup_skipped": dedup_skipped}
+
 
 async def check_wash_reminders(ctx: dict):
     logger.info("Checking wash reminders...")
@@ -344,145 +505,156 @@ async def check_wash_reminders(ctx: dict):
         return {"notified": 0, "skipped": "lock_held"}
 
 
+@dataclass
+class WashReminder:
+    user_id: str
+    channels: list[NotificationSettings]
+    item_count: int
+    title: str
+    body: str
+
+
+async def _send_wash_reminder(
+    reminder: WashReminder,
+    app_url: str,
+    semaphore: asyncio.Semaphore,
+    http_client: httpx.AsyncClient | None = None,
+) -> tuple[bool, str]:
+    """Send via the first channel that succeeds; returns (sent, channel name)."""
+    async with semaphore:
+        # Channels are tried in priority order; stopping at the first success
+        # avoids sending the same reminder over several channels
+        sent = False
+        sent_channel = "unknown"
+        for channel in reminder.channels:
+            try:
+                if channel.channel == "ntfy":
+                    provider = NtfyProvider(NtfyConfig(**channel.config), http_client)
+                    send_result = await provider.send(
+                        NtfyNotification(
+                            topic=provider.topic,
+                            title=reminder.title,
+                            message=reminder.body,
+                            click=f"{app_url}/dashboard/wardrobe",
+                            tags=["shirt", "droplet"],
+                        )
+                    )
+                    sent = send_result.get("success", False)
+                    sent_channel = "ntfy"
+                elif channel.channel == "email":
+                    email_provider = EmailProvider(EmailConfig(**channel.config))
+                    send_result = await email_provider.send(
+                        build_notification_email(
+                            to=email_provider.to_address,
+                            subject=reminder.title,
+                            heading=reminder.title,
+                            body=reminder.body,
+                            cta_text="View Wardrobe",
+                            cta_url=f"{app_url}/dashboard/wardrobe",
+                            app_url=app_url,
+                        )
+                    )
+                    sent = send_result.get("success", False)
+                    sent_channel = "email"
+                elif channel.channel == "expo_push":
+                    provider = ExpoPushProvider(ExpoPushConfig(**channel.config), http_client)
+                    send_result = await provider.send(
+                        ExpoPushMessage(
+                            to=provider.push_token,
+                            title=reminder.title,
+                            body=reminder.body,
+                            data={"screen": "wardrobe"},
+                        )
+                    )
+                    sent = send_result.get("success", False)
+                    sent_channel = "expo_push"
+
+                if sent:
+                    break
+            except Exception as e:
+                logger.warning(f"Failed to send wash reminder via {channel.channel}: {e}")
+
+    return sent, sent_channel
+
+
 async def _check_wash_reminders_inner(ctx: dict):
+    # Load everything up front so no connection is held during provider HTTP calls
     db = get_db_session(ctx)
     try:
+        # Per-user dirty count plus the first few names, aggregated in Postgres
         result = await db.execute(
-            select(ClothingItem).where(
+            select(
+                ClothingItem.user_id,
+                func.count().label("n_items"),
+                func.array_agg(func.coalesce(ClothingItem.name, ClothingItem.type))[1:5].label(
+                    "names"
+                ),
+            )
+            .where(
                 and_(
                     ClothingItem.needs_wash == True,  # noqa: E712
                     ClothingItem.is_archived == False,  # noqa: E712
                 )
             )
+            .group_by(ClothingItem.user_id)
         )
-        dirty_items = list(result.scalars().all())
+        user_items = {str(user_id): (n_items, names) for user_id, n_items, names in result.all()}
 
-        if not dirty_items:
+        if not user_items:
             logger.info("No items need washing")
             return {"notified": 0}
 
-        user_items: dict[str, list] = {}
-        for item in dirty_items:
-            uid = str(item.user_id)
-            if uid not in user_items:
-                user_items[uid] = []
-            user_items[uid].append(item)
-
-        app_url = os.getenv("APP_URL", "http://localhost:3000")
-        notified = 0
+        user_ids = list(user_items)
 
-        for user_id, items in user_items.items():
-            try:
-                # Check if user has notification channels
-                channels_result = await db.execute(
-                    select(NotificationSettings).where(
-                        and_(
-                            NotificationSettings.user_id == user_id,
-                            NotificationSettings.enabled == True,  # noqa: E712
-                        )
-                    )
-                )
-                channels = list(channels_result.scalars().all())
-                if not channels:
-                    continue
-
-                # Check deduplication: don't send more than once per day
-                one_day_ago = datetime.now(UTC) - timedelta(days=1)
-                existing = await db.execute(
-                    select(Notification).where(
-                        and_(
-                            Notification.user_id == user_id,
-                            Notification.payload["type"].astext == "wash_reminder",
-                            Notification.created_at >= one_day_ago,
-                        )
-                    )
+        # Enabled channels for every affected user in one query
+        channels_result = await db.execute(
+            select(NotificationSettings)
+            .where(
+                and_(
+                    NotificationSettings.user_id.in_(user_ids),
+                    NotificationSettings.enabled == True,  # noqa: E712
                 )
-                if existing.scalars().first():
-                    continue
-
-                item_names = [i.name or i.type for i in items[:5]]
-                count = len(items)
-                summary = ", ".join(item_names)
-                if count > 5:
-                    summary += f" and {count - 5} more"
-
-                title = "Laundry Reminder"
-                body = f"{count} item{'s' if count != 1 else ''} need washing: {summary}"
-
-                # Send via first enabled channel
-                sent = False
-                sent_channel = "unknown"
-                for channel in channels:
-                    try:
-                        if channel.channel == "ntfy":
-                            provider = NtfyProvider(NtfyConfig(**channel.config))
-                            send_result = await provider.send(
-                                NtfyNotification(
-                                    title=title,
-                                    message=body,
-                                    click=f"{app_url}/dashboard/wardrobe",
-                                    tags=["shirt", "droplet"],
-                                )
-                            )
-                            sent = send_result.get("success", False)
-                            sent_channel = "ntfy"
-                        elif channel.channel == "email":
-                            email_provider = EmailProvider(EmailConfig(**channel.config))
-                            send_result = await email_provider.send(
-                                build_notification_email(
-                                    to=email_provider.to_address,
-                                    subject=title,
-                                    heading=title,
-                                    body=body,
-                                    cta_text="View Wardrobe",
-                                    cta_url=f"{app_url}/dashboard/wardrobe",
-                                    app_url=app_url,
-                                )
-                            )
-                            sent = send_result.get("success", False)
-                            sent_channel = "email"
-                        elif channel.channel == "expo_push":
-                            provider = ExpoPushProvider(ExpoPushConfig(**channel.config))
-                            send_result = await provider.send(
-                                ExpoPushMessage(
-                                    title=title,
-                                    body=body,
-                                    data={"screen": "wardrobe"},
-                                )
-                            )
-                            sent = send_result.get("success", False)
-                            sent_channel = "expo_push"
-
-                        if sent:
-                            break
-                    except Exception as e:
-                        logger.warning(f"Failed to send wash reminder via {channel.channel}: {e}")
-
-                # Create notification record
-                notification = Notification(
-                    user_id=user_id,
-                    channel=sent_channel,
-                    status=NotificationStatus.sent if sent else NotificationStatus.failed,
-                    payload={
-                        "type": "wash_reminder",
-                        "item_count": count,
-                        "title": title,
-                        "body": body,
-                    },
-                    sent_at=datetime.now(UTC) if sent else None,
-                    error_message=None if sent else "All channels failed",
+            )
+            .order_by(NotificationSettings.priority)
+        )
+        channels_by_user: dict[str, list[NotificationSettings]] = {}
+        for channel in channels_result.scalars().all():
+            channels_by_user.setdefault(str(channel.user_id), []).append(channel)
+
+        # Deduplication: don't send more than once per day
+        one_day_ago = datetime.now(UTC) - timedelta(days=1)
+        recent_result = await db.execute(
+            select(Notification.user_id)
+            .where(
+                and_(
+                    Notification.user_id.in_(user_ids),
+                    Notification.payload["type"].astext == "wash_reminder",
+                    Notification.created_at >= one_day_ago,
                 )
-                db.add(notification)
-                await db.commit()
-                if sent:
-                    notified += 1
+            )
+            .group_by(Notification.user_id)
+        )
+        recently_notified = {str(user_id) for user_id in recent_result.scalars().all()}
 
-            except Exception as e:
-                logger.warning(f"Failed to send wash reminder for user {user_id}: {e}")
+        reminders: list[WashReminder] = []
+        for user_id, (count, item_names) in user_items.items():
+            channels = channels_by_user.get(user_id)
+            if not channels or user_id in recently_notified:
                 continue
 
-        logger.info(f"Sent wash reminders to {notified} users")
-        return {"notified": notified}
+            summary = ", ".join(item_names)
+            if count > 5:
+                summary += f" and {count - 5} more"
+
+            reminders.append(
+                WashReminder(
+                    user_id=user_id,
+                    channels=channels,
+                    item_count=count,
+                    title="Laundry Reminder",
+                    body=f"{count} item{'s' if count != 1 else ''} need washing: {summary}",
+                )
+            )
 
     except Exception as e:
         logger.exception("Error in check_wash_reminders")
@@ -490,64 +662,109 @@ async def _check_wash_reminders_inner(ctx: dict):
     finally:
         await db.close()
 
+    notified = 0
+    notification_rows: list[dict] = []
+
+    # Users are independent, so their sends overlap
+    semaphore = asyncio.Semaphore(WASH_REMINDER_CONCURRENCY)
+    outcomes = await asyncio.gather(
+        *(
+            _send_wash_reminder(reminder, ctx["app_url"], semaphore, ctx.get("http_client"))
+            for reminder in reminders
+        ),
+        return_exceptions=True,
+    )
+
+    for reminder, outcome in zip(reminders, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            logger.warning(f"Failed to send wash reminder for user {reminder.user_id}: {outcome}")
+            continue
+        sent, sent_channel = outcome
+
+        notification_rows.append(
+            {
+                "user_id": reminder.user_id,
+                "channel": sent_channel,
+                "status": NotificationStatus.sent if sent else NotificationStatus.failed,
+                "payload": {
+                    "type": "wash_reminder",
+                    "item_count": reminder.item_count,
+                    "title": reminder.title,
+                    "body": reminder.body,
+                },
+                "sent_at": datetime.now(UTC) if sent else None,
+                "error_message": None if sent else "All channels failed",
+            }
+        )
+        if sent:
+            notified += 1
+
+    # Record all deliveries with one multi-row INSERT in a short-lived session
+    if notification_rows:
+        db = get_db_session(ctx)
+        try:
+            await db.execute(insert(Notification), notification_rows)
+            await db.commit()
+        except Exception as e:
+            logger.exception("Failed to record wash reminder notifications")
+            await db.rollback()
+            return {"notified": notified, "error": str(e)}
+        finally:
+            await db.close()
+
+    logger.info(f"Sent wash reminders to {notified} users")
+    return {"notified": notified}
+
+
+async def _update_learning_profile(ctx: dict, user_id: UUID, semaphore: asyncio.Semaphore) -> bool:
+    async with semaphore:
+        db = get_db_session(ctx)
+        try:
+            learning_service = LearningService(db)
+            await learning_service.recompute_learning_profile(user_id)
+            await learning_service.generate_insights(user_id)
+            logger.info(f"Updated learning profile for user {user_id}")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to update learning profile for user {user_id}: {e}")
+            await db.rollback()
+            return False
+        finally:
+            await db.close()
+
 
 async def update_learning_profiles(ctx: dict):
     logger.info("Starting periodic learning profile updates...")
 
+    now = datetime.now(UTC)
+    if not await _claim_cron_tick(ctx, "update_learning_profiles", now):
+        return {"updated": 0, "skipped": "not_leader"}
+
     db = get_db_session(ctx)
     try:
-        now = datetime.now(UTC)
         one_hour_ago = now - timedelta(hours=1)
 
-        # Find users with recent feedback who need profile updates
-        # (accepted/rejected outfits in last hour)
+        # Find users with recent feedback (accepted/rejected outfits in last hour)
+        # whose profile doesn't exist yet or is stale
         result = await db.execute(
             select(User.id)
             .join(Outfit, User.id == Outfit.user_id)
+            .outerjoin(UserLearningProfile, UserLearningProfile.user_id == User.id)
             .where(
                 and_(
                     User.is_active.is_(True),
                     Outfit.status.in_([OutfitStatus.accepted, OutfitStatus.rejected]),
                     Outfit.responded_at >= one_hour_ago,
+                    or_(
+                        UserLearningProfile.user_id.is_(None),
+                        UserLearningProfile.last_computed_at.is_(None),
+                        UserLearningProfile.last_computed_at < one_hour_ago,
+                    ),
                 )
             )
             .distinct()
         )
-        users_with_recent_feedback = {row[0] for row in result.all()}
-
-        if not users_with_recent_feedback:
-            logger.info("No users with recent feedback to update")
-            return {"updated": 0}
-
-        learning_service = LearningService(db)
-        updated_count = 0
-
-        for user_id in users_with_recent_feedback:
-            try:
-                # Check if profile needs update (doesn't exist or is stale)
-                profile_result = await db.execute(
-                    select(UserLearningProfile).where(UserLearningProfile.user_id == user_id)
-                )
-                profile = profile_result.scalar_one_or_none()
-
-                needs_update = (
-                    profile is None
-                    or profile.last_computed_at is None
-                    or profile.last_computed_at < one_hour_ago
-                )
-
-                if needs_update:
-                    await learning_service.recompute_learning_profile(user_id)
-                    await learning_service.generate_insights(user_id)
-                    updated_count += 1
-                    logger.info(f"Updated learning profile for user {user_id}")
-
-            except Exception as e:
-                logger.warning(f"Failed to update learning profile for user {user_id}: {e}")
-                continue
-
-        logger.info(f"Completed learning profile updates: {updated_count} profiles updated")
-        return {"updated": updated_count}
+        user_ids = list(result.scalars().all())
 
     except Exception as e:
         logger.exception("Error in update_learning_profiles")
@@ -555,6 +772,19 @@ async def update_learning_profiles(ctx: dict):
     finally:
         await db.close()
 
+    if not user_ids:
+        logger.info("No users with recent feedback to update")
+        return {"updated": 0}
+
+    semaphore = asyncio.Semaphore(LEARNING_CONCURRENCY)
+    outcomes = await asyncio.gather(
+        *(_update_learning_profile(ctx, user_id, semaphore) for user_id in user_ids)
+    )
+    updated_count = sum(outcomes)
+
+    logger.info(f"Completed learning profile updates: {updated_count} profiles updated")
+    return {"updated": updated_count}
+
 
 class WorkerSettings:
     functions = [
@@ -567,8 +797,8 @@ class WorkerSettings:
     ]
 
     cron_jobs = [
-        # Retry failed notifications every 5 minutes
-        cron(retry_failed_notifications, minute={0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55}),
+        # Retry failed notifications every 5 minutes, offset from the other crons
+        cron(retry_failed_notifications, minute={2, 7, 12, 17, 22, 27, 32, 37, 42, 47, 52, 57}),
         # Check scheduled notifications every minute
         cron(check_scheduled_notifications, minute=None),  # Every minute
         # Check wash reminders every 6 hours (at minute 15)
@@ -1,12 +1,16 @@
 import logging
+import os
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
+import httpx
 from sqlalchemy import select
 
 from app.models.item import ClothingItem, ItemStatus
 from app.services.ai_service import AIService, ClothingTags
+from app.services.weather_service import get_weather_service
+from app.utils.redis_lock import close_redis, warmup_redis
 from app.workers.db import close_db, get_db_session, init_db
 
 logger = logging.getLogger(__name__)
@@ -191,6 +195,14 @@ async def startup(ctx: dict) -> None:
     """Worker startup hook."""
     logger.info("Tagging worker starting up...")
     await init_db(ctx)
+    await warmup_redis()
+    # Process-lifetime values shared by the notification jobs
+    ctx["app_url"] = os.getenv("APP_URL", "http://localhost:3000")
+    ctx["weather_service"] = get_weather_service()
+    ctx["http_client"] = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
     ctx["ai_service"] = AIService()
     health = await ctx["ai_service"].check_health()
     logger.info(f"AI service health: {health}")
@@ -200,6 +212,10 @@ async def shutdown(ctx: dict) -> None:
     """Worker shutdown hook."""
     logger.info("Tagging worker shutting down...")
     await close_db(ctx)
+    await close_redis()
+    http_client = ctx.pop("http_client", None)
+    if http_client is not None:
+        await http_client.aclose()
 
 
 class WorkerSettings:
@@ -210,6 +226,7 @@ class WorkerSettings:
 
     from app.workers.notifications import (
         check_scheduled_notifications,
+        process_scheduled_notification,
         retry_failed_notifications,
         send_notification,
     )
@@ -219,11 +236,13 @@ class WorkerSettings:
         send_notification,
         retry_failed_notifications,
         check_scheduled_notifications,
+        # Enqueued by check_scheduled_notifications onto this queue
+        process_scheduled_notification,
     ]
 
     cron_jobs = [
-        # Retry failed notifications every 5 minutes
-        cron(retry_failed_notifications, minute={0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55}),
+        # Retry failed notifications every 5 minutes, offset from the other crons
+        cron(retry_failed_notifications, minute={2, 7, 12, 17, 22, 27, 32, 37, 42, 47, 52, 57}),
         # Check scheduled notifications every minute
         cron(check_scheduled_notifications, minute=None),
     ]
@@ -0,0 +1,32 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6a7b8c9d0"
+down_revision: str | None = "d4e5f6a7b8c9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Enabled-channel lookups by user in the notification worker. Built
+    # concurrently so existing deployments don't block writes meanwhile.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_notification_settings_enabled",
+            "notification_settings",
+            ["user_id"],
+            postgresql_where=sa.text("enabled"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_notification_settings_enabled",
+            table_name="notification_settings",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,40 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: str | None = "45702c628c1f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Minute-by-minute due schedule scan in check_scheduled_notifications
+    op.create_index(
+        "ix_schedules_cron_enabled",
+        "schedules",
+        ["day_of_week", "notify_day_before"],
+        postgresql_where=sa.text("enabled = true"),
+    )
+    # Once-a-day dedup probe in check_wash_reminders
+    op.create_index(
+        "ix_notifications_wash_dedup",
+        "notifications",
+        ["user_id", sa.text("created_at DESC")],
+        postgresql_where=sa.text("payload->>'type' = 'wash_reminder'"),
+    )
+    # Dirty items scan in check_wash_reminders
+    op.create_index(
+        "ix_clothing_items_needs_wash",
+        "clothing_items",
+        ["user_id"],
+        postgresql_where=sa.text("needs_wash AND NOT is_archived"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_clothing_items_needs_wash", table_name="clothing_items")
+    op.drop_index("ix_notifications_wash_dedup", table_name="notifications")
+    op.drop_index("ix_schedules_cron_enabled", table_name="schedules")
@@ -27,12 +27,15 @@ TEST_DATABASE_URL = os.getenv(
 )
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_engine():
-    """Create async engine for each test."""
+    """Create one async engine shared by the whole test session."""
+    # Tests use one or two connections at a time; a small pool is plenty
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
+        pool_size=2,
+        max_overflow=2,
     )
 
     async with engine.begin() as conn:
@@ -0,0 +1,128 @@
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import images
+from app.api.auth import create_access_token
+from app.models.family import Family
+from app.models.user import User
+from app.services.image_service import ImageService
+from app.utils.signed_urls import sign_image_url
+
+
+@pytest.fixture
+def stored_image(test_user) -> str:
+    storage = ImageService().storage_path
+    user_dir: Path = storage / str(test_user.id)
+    user_dir.mkdir(parents=True, exist_ok=True)
+    filename = f"{uuid4().hex}.jpg"
+    (user_dir / filename).write_bytes(b"\xff\xd8\xff\xe0fake-jpeg")
+    return f"{test_user.id}/{filename}"
+
+
+class TestGetImage:
+    @pytest.mark.asyncio
+    async def test_owner_can_fetch(self, client: AsyncClient, auth_headers, stored_image):
+        response = await client.get(f"/api/v1/images/{stored_image}", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.content == b"\xff\xd8\xff\xe0fake-jpeg"
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304(self, client: AsyncClient, auth_headers, stored_image):
+        first = await client.get(f"/api/v1/images/{stored_image}", headers=auth_headers)
+        etag = first.headers["etag"]
+
+        response = await client.get(
+            f"/api/v1/images/{stored_image}",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_returns_file(self, client: AsyncClient, auth_headers, stored_image):
+        response = await client.get(
+            f"/api/v1/images/{stored_image}",
+            headers={**auth_headers, "If-None-Match": 'W/"stale"'},
+        )
+        assert response.status_code == 200
+        assert response.content == b"\xff\xd8\xff\xe0fake-jpeg"
+
+    @pytest.mark.asyncio
+    async def test_signed_url_grants_access(self, client: AsyncClient, stored_image):
+        response = await client.get(sign_image_url(stored_image))
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_anonymous_without_signature_denied(self, client: AsyncClient, stored_image):
+        response = await client.get(f"/api/v1/images/{stored_image}")
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_other_user_denied(self, client: AsyncClient, auth_headers):
+        response = await client.get(f"/api/v1/images/{uuid4()}/photo.jpg", headers=auth_headers)
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_family_member_can_fetch(
+        self, client: AsyncClient, test_user, db_session: AsyncSession, stored_image
+    ):
+        family = Family(name="Test Family", created_by=test_user.id, invite_code=uuid4().hex[:8])
+        db_session.add(family)
+        await db_session.flush()
+        test_user.family_id = family.id
+        uid = uuid4()
+        member = User(
+            id=uid,
+            external_id=f"test-user-{uid}",
+            email=f"test-{uid}@example.com",
+            display_name="Family Member",
+            family_id=family.id,
+        )
+        db_session.add(member)
+        await db_session.commit()
+
+        headers = {"Authorization": f"Bearer {create_access_token(member.external_id)}"}
+        response = await client.get(f"/api/v1/images/{stored_image}", headers=headers)
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_invalid_user_id_rejected(self, client: AsyncClient, auth_headers):
+        response = await client.get("/api/v1/images/not-a-uuid/photo.jpg", headers=auth_headers)
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_user_id_with_trailing_newline_rejected(self, client: AsyncClient, auth_headers):
+        # "$" alone would let a trailing "\n" through the format check
+        response = await client.get(f"/api/v1/images/{uuid4()}%0A/photo.jpg", headers=auth_headers)
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_invalid_filename_rejected(self, client: AsyncClient, test_user, auth_headers):
+        response = await client.get(
+            f"/api/v1/images/{test_user.id}/photo.gif", headers=auth_headers
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_missing_file_returns_404(self, client: AsyncClient, test_user, auth_headers):
+        response = await client.get(
+            f"/api/v1/images/{test_user.id}/missing.jpg", headers=auth_headers
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_internal_redirect_offloads_file(
+        self, client: AsyncClient, auth_headers, stored_image, monkeypatch
+    ):
+        monkeypatch.setattr(images.settings, "internal_file_prefix", "/_images/")
+        response = await client.get(f"/api/v1/images/{stored_image}", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["x-accel-redirect"] == f"/_images/{stored_image}"
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.content == b""
@@ -131,6 +131,58 @@ class TestItemCRUD:
         assert data["id"] == str(item.id)
         assert data["name"] == "Test Shirt"
 
+    @pytest.mark.asyncio
+    async def test_get_item_includes_signed_urls(
+        self, client: AsyncClient, test_user, auth_headers, db_session: AsyncSession
+    ):
+        """Test that image URLs are signed with a shared expiry."""
+        item = ClothingItem(
+            user_id=test_user.id,
+            type="shirt",
+            image_path="test/item.jpg",
+            thumbnail_path="test/item_thumb.jpg",
+            status=ItemStatus.ready,
+        )
+        db_session.add(item)
+        await db_session.commit()
+        await db_session.refresh(item)
+
+        response = await client.get(f"/api/v1/items/{item.id}", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["image_url"].startswith("/api/v1/images/test/item.jpg?expires=")
+        assert data["thumbnail_url"].startswith("/api/v1/images/test/item_thumb.jpg?expires=")
+        assert data["medium_url"] is None
+        image_expires = data["image_url"].split("expires=")[1].split("&")[0]
+        thumb_expires = data["thumbnail_url"].split("expires=")[1].split("&")[0]
+        assert image_expires == thumb_expires
+
+    @pytest.mark.asyncio
+    async def test_get_item_returns_typed_tags(
+        self, client: AsyncClient, test_user, auth_headers, db_session: AsyncSession
+    ):
+        """Test that tags are returned as a structured object without flat duplicates."""
+        item = ClothingItem(
+            user_id=test_user.id,
+            type="shirt",
+            image_path="test/item.jpg",
+            status=ItemStatus.ready,
+            pattern="striped",
+            tags={"colors": ["blue"], "pattern": "striped", "occasion": ["work"]},
+        )
+        db_session.add(item)
+        await db_session.commit()
+        await db_session.refresh(item)
+
+        response = await client.get(f"/api/v1/items/{item.id}", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tags"]["colors"] == ["blue"]
+        assert data["tags"]["pattern"] == "striped"
+        assert data["tags"]["occasion"] == ["work"]
+        assert data["tags"]["style"] == []
+        assert "pattern" not in data
+
     @pytest.mark.asyncio
     async def test_update_item(
         self, client: AsyncClient, test_user, auth_headers, db_session: AsyncSession
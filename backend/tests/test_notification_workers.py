@@ -1,29 +1,67 @@
 """Tests for notification worker concurrency fixes."""
 
+import asyncio
+import pickle
 import uuid
-from datetime import UTC, datetime, time, timedelta
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from datetime import UTC, date, datetime, time, timedelta
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import delete
+from sqlalchemy import delete, insert, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.notification import NotificationSettings
+from app.models.item import ClothingItem
+from app.models.learning import UserLearningProfile
+from app.models.notification import Notification, NotificationSettings, NotificationStatus
+from app.models.outfit import Outfit, OutfitStatus
 from app.models.schedule import Schedule
 from app.models.user import User
-from app.workers.notifications import check_scheduled_notifications, process_scheduled_notification
+from app.services.notification_service import DeliveryStatus, NotificationResult
+from app.workers.notifications import (
+    _check_wash_reminders_inner,
+    _retry_notification,
+    check_scheduled_notifications,
+    process_scheduled_notification,
+    retry_failed_notifications,
+    update_learning_profiles,
+)
 
-
-@pytest_asyncio.fixture(autouse=True)
-async def clean_schedules(db_session: AsyncSession):
-    await db_session.execute(delete(Schedule))
-    await db_session.commit()
+APP_URL = "http://localhost:3000"
 
 
 @pytest_asyncio.fixture
-async def schedule_user(db_session: AsyncSession) -> User:
+async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
+    """Session inside an outer transaction that is rolled back after each test.
+
+    Commits made by the tests and by the workers only release a SAVEPOINT, so
+    nothing is persisted and no per-test cleanup is needed.
+    """
+    async with async_engine.connect() as conn:
+        outer = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        # Hide schedules committed by other test modules from the due scan
+        await session.execute(delete(Schedule))
+        try:
+            yield session
+        finally:
+            await session.close()
+            await outer.rollback()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def schedule_user(async_engine) -> AsyncGenerator[User, None]:
+    # Committed once for the module, outside the per-test transactions, so
+    # tests must not change it in place; everything they add is rolled back.
     unique_id = uuid.uuid4()
     user = User(
         id=unique_id,
@@ -37,12 +75,16 @@ async def schedule_user(db_session: AsyncSession) -> User:
         location_lon=Decimal("-74.00597200"),
         location_name="New York",
     )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    return user
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        session.add(user)
+        await session.commit()
+    yield user
+    async with async_engine.begin() as conn:
+        await conn.execute(delete(User).where(User.id == unique_id))
 
 
+# Per test rather than per module: test_no_enabled_channels_returns_skipped needs
+# the same user without a channel, which a module-wide row would break.
 @pytest_asyncio.fixture
 async def ntfy_channel(db_session: AsyncSession, schedule_user: User) -> NotificationSettings:
     channel = NotificationSettings(
@@ -53,18 +95,77 @@ async def ntfy_channel(db_session: AsyncSession, schedule_user: User) -> Notific
     )
     db_session.add(channel)
     await db_session.commit()
-    await db_session.refresh(channel)
     return channel
 
 
+@pytest.fixture
+def notif_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Stub the recommendation service and dispatcher used by process_scheduled_notification."""
+    outfit = MagicMock(id=uuid.uuid4())
+    rec = MagicMock(
+        generate_recommendation=AsyncMock(return_value=outfit),
+        prefetch_wardrobe=AsyncMock(return_value=[]),
+    )
+    dispatcher = MagicMock(send_outfit_notification=AsyncMock(return_value=[]))
+    monkeypatch.setattr("app.workers.notifications.RecommendationService", lambda *a, **kw: rec)
+    monkeypatch.setattr(
+        "app.workers.notifications.NotificationDispatcher", lambda *a, **kw: dispatcher
+    )
+    return SimpleNamespace(rec=rec, dispatcher=dispatcher, outfit=outfit)
+
+
+def _redis_mock() -> MagicMock:
+    # set() answers the cron leader check; True means this worker won the tick.
+    # Bulk enqueues are queued with redis.pipe.eval() and flushed by execute().
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=lambda **kwargs: [1] * pipe.eval.call_count)
+    redis = MagicMock(
+        set=AsyncMock(return_value=True), expires_extra_ms=86_400_000, job_serializer=None
+    )
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    redis.pipe = pipe
+    return redis
+
+
+def _worker_ctx(db_session: AsyncSession, **extra) -> dict:
+    # Workers open sessions through ctx["db_session_factory"]; hand them the test session
+    return {"db_session_factory": lambda: db_session, **extra}
+
+
+def _enqueued_jobs(redis: MagicMock) -> list[dict]:
+    jobs = []
+    for call in redis.pipe.eval.call_args_list:
+        _, _, _, _, queue, job_id, _, _, body = call.args
+        job = pickle.loads(body)
+        jobs.append({"job_id": job_id, "queue": queue, "function": job["f"], "args": job["a"]})
+    return jobs
+
+
+# Mid-day and mid-minute, so the due window never straddles a boundary
+_FROZEN_NOW = datetime(2025, 6, 4, 12, 30, 30, tzinfo=UTC)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return _FROZEN_NOW.astimezone(tz) if tz else _FROZEN_NOW.replace(tzinfo=None)
+
+
+@pytest.fixture
+def freeze_time(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    monkeypatch.setattr("app.workers.notifications.datetime", _FrozenDatetime)
+    return _FROZEN_NOW
+
+
 def _make_due_schedule(
     user: User,
     *,
+    now: datetime | None = None,
     offset_minutes: int = 0,
     last_triggered_at: datetime | None = None,
     notify_day_before: bool = False,
 ) -> Schedule:
-    now = datetime.now(UTC)
+    now = now or datetime.now(UTC)
     target = now + timedelta(minutes=offset_minutes)
     day = now.weekday() if not notify_day_before else (now.weekday() + 1) % 7
     return Schedule(
@@ -79,34 +180,55 @@ def _make_due_schedule(
     )
 
 
+async def _bulk_add_schedules(
+    session: AsyncSession, users: list[User], n: int, *, now: datetime
+) -> list[uuid.UUID]:
+    """Insert *n* schedules due at *now* for each user in one multi-row INSERT."""
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user.id,
+            "day_of_week": now.weekday(),
+            "notification_time": time(now.hour, now.minute),
+            "occasion": "casual",
+            "enabled": True,
+            "notify_day_before": False,
+        }
+        for user in users
+        for _ in range(n)
+    ]
+    await session.execute(insert(Schedule), rows)
+    await session.commit()
+    return [row["id"] for row in rows]
+
+
 # ── check_scheduled_notifications ──
 
 
+@pytest.mark.usefixtures("freeze_time")
 class TestCheckScheduledNotifications:
     @pytest.mark.asyncio
     async def test_due_schedule_gets_marked_and_enqueued(
         self, db_session: AsyncSession, schedule_user: User
     ):
-        schedule = _make_due_schedule(schedule_user)
+        schedule = _make_due_schedule(schedule_user, now=_FROZEN_NOW)
         db_session.add(schedule)
         await db_session.commit()
 
-        enqueue_mock = AsyncMock()
-        ctx = {"redis": MagicMock(enqueue_job=enqueue_mock)}
+        redis = _redis_mock()
+        ctx = _worker_ctx(db_session, redis=redis)
 
-        with (
-            patch("app.workers.notifications.get_db_session", return_value=db_session),
-            patch.object(db_session, "close", new_callable=AsyncMock),
-        ):
-            result = await check_scheduled_notifications(ctx)
+        result = await check_scheduled_notifications(ctx)
 
         assert result["enqueued"] == 1
-        enqueue_mock.assert_called_once()
-        call_args = enqueue_mock.call_args
-        assert call_args.args == ("process_scheduled_notification", str(schedule.id))
-        assert call_args.kwargs["_queue_name"] == "arq:tagging"
-        assert call_args.kwargs["_job_id"].startswith(f"sched:{schedule.id}:")
-        await db_session.refresh(schedule)
+        [job] = _enqueued_jobs(redis)
+        assert job["function"] == "process_scheduled_notification"
+        assert job["args"] == (str(schedule.id),)
+        assert job["queue"] == "arq:tagging"
+        assert job["job_id"] == f"sched:{schedule.id}:202506041230"
+        assert redis.pipe.execute.await_count == 1
+        # No SCRIPT EXISTS/LOAD round-trip ahead of the batch
+        redis.register_script.assert_not_called()
         assert schedule.last_triggered_at is not None
 
     @pytest.mark.asyncio
@@ -115,18 +237,15 @@ class TestCheckScheduledNotifications:
     ):
         schedule = _make_due_schedule(
             schedule_user,
-            last_triggered_at=datetime.now(UTC) - timedelta(minutes=10),
+            now=_FROZEN_NOW,
+            last_triggered_at=_FROZEN_NOW - timedelta(minutes=10),
         )
         db_session.add(schedule)
         await db_session.commit()
 
-        ctx = {"redis": MagicMock(enqueue_job=AsyncMock())}
+        ctx = _worker_ctx(db_session, redis=_redis_mock())
 
-        with (
-            patch("app.workers.notifications.get_db_session", return_value=db_session),
-            patch.object(db_session, "close", new_callable=AsyncMock),
-        ):
-            result = await check_scheduled_notifications(ctx)
+        result = await check_scheduled_notifications(ctx)
 
         assert result["enqueued"] == 0
 
@@ -134,30 +253,100 @@ class TestCheckScheduledNotifications:
     async def test_schedule_outside_time_window_is_skipped(
         self, db_session: AsyncSession, schedule_user: User
     ):
-        schedule = _make_due_schedule(schedule_user, offset_minutes=30)
+        schedule = _make_due_schedule(schedule_user, now=_FROZEN_NOW, offset_minutes=30)
         db_session.add(schedule)
         await db_session.commit()
 
-        ctx = {"redis": MagicMock(enqueue_job=AsyncMock())}
+        ctx = _worker_ctx(db_session, redis=_redis_mock())
 
-        with (
-            patch("app.workers.notifications.get_db_session", return_value=db_session),
-            patch.object(db_session, "close", new_callable=AsyncMock),
-        ):
+        result = await check_scheduled_notifications(ctx)
+
+        assert result["enqueued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_window_covers_adjacent_minutes_only(
+        self, db_session: AsyncSession, schedule_user: User
+    ):
+        in_window = [
+            _make_due_schedule(schedule_user, now=_FROZEN_NOW, offset_minutes=m) for m in (-1, 1)
+        ]
+        outside = [
+            _make_due_schedule(schedule_user, now=_FROZEN_NOW, offset_minutes=m) for m in (-2, 2)
+        ]
+        db_session.add_all(in_window + outside)
+        await db_session.commit()
+
+        redis = _redis_mock()
+        ctx = _worker_ctx(db_session, redis=redis)
+
+        await check_scheduled_notifications(ctx)
+
+        enqueued = {job["args"][0] for job in _enqueued_jobs(redis)}
+        assert enqueued == {str(schedule.id) for schedule in in_window}
+
+    @pytest.mark.asyncio
+    async def test_schedule_marked_after_select_is_not_claimed(
+        self, db_session: AsyncSession, schedule_user: User
+    ):
+        schedule = _make_due_schedule(schedule_user, now=_FROZEN_NOW)
+        db_session.add(schedule)
+        await db_session.commit()
+
+        original_execute = db_session.execute
+        raced = False
+
+        async def racing_execute(statement, *args, **kwargs):
+            nonlocal raced
+            result = await original_execute(statement, *args, **kwargs)
+            if not raced:
+                # Another worker marks the row between our SELECT and UPDATE,
+                # behind the back of the ORM objects the SELECT loaded
+                raced = True
+                await original_execute(
+                    update(Schedule.__table__)
+                    .where(Schedule.__table__.c.id == schedule.id)
+                    .values(last_triggered_at=_FROZEN_NOW - timedelta(minutes=1))
+                )
+            return result
+
+        redis = _redis_mock()
+        ctx = _worker_ctx(db_session, redis=redis)
+
+        with patch.object(db_session, "execute", side_effect=racing_execute):
             result = await check_scheduled_notifications(ctx)
 
+        assert result["checked"] == 1
         assert result["enqueued"] == 0
+        assert _enqueued_jobs(redis) == []
+        redis.pipeline.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_multiple_due_schedules_all_committed_before_enqueue(
+    async def test_skips_when_another_worker_claimed_the_minute(
         self, db_session: AsyncSession, schedule_user: User
     ):
-        s1 = _make_due_schedule(schedule_user)
-        s2 = _make_due_schedule(schedule_user)
-        s2.occasion = "work"
-        db_session.add_all([s1, s2])
+        schedule = _make_due_schedule(schedule_user, now=_FROZEN_NOW)
+        db_session.add(schedule)
         await db_session.commit()
 
+        redis = _redis_mock()
+        redis.set.return_value = None
+        ctx = _worker_ctx(db_session, redis=redis)
+
+        result = await check_scheduled_notifications(ctx)
+
+        assert result["skipped"] == "not_leader"
+        redis.pipeline.assert_not_called()
+        key = redis.set.call_args.args[0]
+        assert key.startswith("cron:check_scheduled_notifications:")
+        assert redis.set.call_args.kwargs == {"nx": True, "ex": 90}
+        assert schedule.last_triggered_at is None
+
+    @pytest.mark.asyncio
+    async def test_multiple_due_schedules_all_committed_before_enqueue(
+        self, db_session: AsyncSession, schedule_user: User
+    ):
+        schedule_ids = await _bulk_add_schedules(db_session, [schedule_user], 2, now=_FROZEN_NOW)
+
         call_order: list[str] = []
         original_commit = db_session.commit
 
@@ -165,42 +354,55 @@ class TestCheckScheduledNotifications:
             call_order.append("commit")
             await original_commit()
 
-        enqueue_mock = AsyncMock(side_effect=lambda *a, **kw: call_order.append("enqueue"))
-        ctx = {"redis": MagicMock(enqueue_job=enqueue_mock)}
+        redis = _redis_mock()
+        redis.pipe.execute.side_effect = lambda **kwargs: call_order.append("enqueue") or [1, 1]
+        ctx = _worker_ctx(db_session, redis=redis)
 
-        with (
-            patch("app.workers.notifications.get_db_session", return_value=db_session),
-            patch.object(db_session, "close", new_callable=AsyncMock),
-            patch.object(db_session, "commit", side_effect=tracking_commit),
-        ):
+        with patch.object(db_session, "commit", side_effect=tracking_commit):
             result = await check_scheduled_notifications(ctx)
 
         assert result["enqueued"] == 2
-        # commit happens before any enqueue
+        # commit happens before any enqueue, and both jobs go out in one round-trip
         assert call_order.index("commit") < call_order.index("enqueue")
+        assert {job["args"][0] for job in _enqueued_jobs(redis)} == {str(i) for i in schedule_ids}
+        assert redis.pipe.execute.await_count == 1
 
     @pytest.mark.asyncio
     async def test_enqueue_failure_does_not_rollback_last_triggered_at(
         self, db_session: AsyncSession, schedule_user: User
     ):
-        schedule = _make_due_schedule(schedule_user)
+        schedule = _make_due_schedule(schedule_user, now=_FROZEN_NOW)
         db_session.add(schedule)
         await db_session.commit()
 
-        enqueue_mock = AsyncMock(side_effect=ConnectionError("redis down"))
-        ctx = {"redis": MagicMock(enqueue_job=enqueue_mock)}
+        redis = _redis_mock()
+        redis.pipe.execute.side_effect = ConnectionError("redis down")
+        ctx = _worker_ctx(db_session, redis=redis)
 
-        with (
-            patch("app.workers.notifications.get_db_session", return_value=db_session),
-            patch.object(db_session, "close", new_callable=AsyncMock),
-        ):
-            result = await check_scheduled_notifications(ctx)
+        result = await check_scheduled_notifications(ctx)
 
         # Schedule was still marked even though enqueue failed
-        assert result["enqueued"] == 1
-        await db_session.refresh(schedule)
+        assert result["checked"] == 1
+        assert result["enqueued"] == 0
         assert schedule.last_triggered_at is not None
 
+    @pytest.mark.asyncio
+    async def test_concurrent_poller_dedupe(self, db_session: AsyncSession, schedule_user: User):
+        schedule = _make_due_schedule(schedule_user, now=_FROZEN_NOW)
+        db_session.add(schedule)
+        await db_session.commit()
+
+        # The enqueue script returns 0 when the job id is already queued
+        redis = _redis_mock()
+        redis.pipe.execute.side_effect = lambda **kwargs: [0]
+        ctx = _worker_ctx(db_session, redis=redis)
+
+        result = await check_scheduled_notifications(ctx)
+
+        assert result["checked"] == 1
+        assert result["enqueued"] == 0
+        assert result["dedup_skipped"] == 1
+
 
 # ── process_scheduled_notification ──
 
@@ -208,53 +410,53 @@ class TestCheckScheduledNotifications:
 class TestProcessScheduledNotification:
     @pytest.mark.asyncio
     async def test_happy_path_generates_outfit_and_sends(
-        self, db_session: AsyncSession, schedule_user: User, ntfy_channel
+        self, db_session: AsyncSession, schedule_user: User, ntfy_channel, notif_mocks
     ):
         schedule = _make_due_schedule(schedule_user)
         db_session.add(schedule)
         await db_session.commit()
 
-        mock_outfit = MagicMock()
-        mock_outfit.id = uuid.uuid4()
+        ctx = _worker_ctx(db_session, job_try=1, app_url=APP_URL, weather_service=MagicMock())
+        result = await process_scheduled_notification(ctx, str(schedule.id))
 
-        mock_rec_service = MagicMock()
-        mock_rec_service.generate_recommendation = AsyncMock(return_value=mock_outfit)
+        assert result["status"] == "sent"
+        assert result["outfit_id"] == str(notif_mocks.outfit.id)
+        notif_mocks.rec.generate_recommendation.assert_called_once()
+        user = notif_mocks.rec.generate_recommendation.call_args.kwargs["user"]
+        assert "preferences" not in inspect(user).unloaded
+        notif_mocks.dispatcher.send_outfit_notification.assert_called_once()
 
-        mock_dispatcher = MagicMock()
-        mock_dispatcher.send_outfit_notification = AsyncMock(return_value=[])
+    @pytest.mark.asyncio
+    async def test_day_before_prefetches_wardrobe_with_forecast(
+        self, db_session: AsyncSession, schedule_user: User, ntfy_channel, notif_mocks
+    ):
+        schedule = _make_due_schedule(schedule_user, notify_day_before=True)
+        db_session.add(schedule)
+        await db_session.commit()
 
-        ctx = {"job_try": 1}
+        forecast = MagicMock(temperature=12.0, condition="rain")
+        weather_service = MagicMock(get_tomorrow_weather=AsyncMock(return_value=forecast))
+        candidates = [MagicMock(), MagicMock()]
+        notif_mocks.rec.prefetch_wardrobe.return_value = candidates
 
-        with (
-            patch("app.workers.notifications.get_db_session", return_value=db_session),
-            patch.object(db_session, "close", new_callable=AsyncMock),
-            patch(
-                "app.workers.notifications.RecommendationService",
-                return_value=mock_rec_service,
-            ),
-            patch(
-                "app.workers.notifications.NotificationDispatcher",
-                return_value=mock_dispatcher,
-            ),
-            patch("app.services.weather_service.get_weather_service"),
-        ):
-            result = await process_scheduled_notification(ctx, str(schedule.id))
+        ctx = _worker_ctx(db_session, job_try=1, app_url=APP_URL, weather_service=weather_service)
+        result = await process_scheduled_notification(ctx, str(schedule.id))
 
         assert result["status"] == "sent"
-        assert result["outfit_id"] == str(mock_outfit.id)
-        mock_rec_service.generate_recommendation.assert_called_once()
-        mock_dispatcher.send_outfit_notification.assert_called_once()
+        weather_service.get_tomorrow_weather.assert_awaited_once()
+        notif_mocks.rec.prefetch_wardrobe.assert_awaited_once()
+        kwargs = notif_mocks.rec.generate_recommendation.call_args.kwargs
+        assert kwargs["weather_override"] is forecast
+        assert kwargs["candidates"] is candidates
+        send = notif_mocks.dispatcher.send_outfit_notification
+        assert send.call_args.kwargs["for_tomorrow"] is True
 
     @pytest.mark.asyncio
     async def test_missing_schedule_returns_skipped(self, db_session: AsyncSession):
-        ctx = {"job_try": 1}
+        ctx = _worker_ctx(db_session, job_try=1)
         fake_id = str(uuid.uuid4())
 
-        with (
-            patch("app.workers.notifications.get_db_session", return_value=db_session),
-            patch.object(db_session, "close", new_callable=AsyncMock),
-        ):
-            result = await process_scheduled_notification(ctx, fake_id)
+        result = await process_scheduled_notification(ctx, fake_id)
 
         assert result == {"status": "skipped", "reason": "not_found"}
 
@@ -262,20 +464,19 @@ class TestProcessScheduledNotification:
     async def test_deleted_user_returns_skipped(
         self, db_session: AsyncSession, schedule_user: User
     ):
-        schedule_user.is_active = False
+        # Deactivate inside this test's transaction, leaving the shared user intact
+        await db_session.execute(
+            update(User).where(User.id == schedule_user.id).values(is_active=False)
+        )
         await db_session.commit()
 
         schedule = _make_due_schedule(schedule_user)
         db_session.add(schedule)
         await db_session.commit()
 
-        ctx = {"job_try": 1}
+        ctx = _worker_ctx(db_session, job_try=1)
 
-        with (
-            patch("app.workers.notifications.get_db_session", return_value=db_session),
-            patch.object(db_session, "close", new_callable=AsyncMock),
-        ):
-            result = await process_scheduled_notification(ctx, str(schedule.id))
+        result = await process_scheduled_notification(ctx, str(schedule.id))
 
         assert result == {"status": "skipped", "reason": "user_not_found"}
 
@@ -287,68 +488,273 @@ class TestProcessScheduledNotification:
         db_session.add(schedule)
         await db_session.commit()
 
-        ctx = {"job_try": 1}
+        ctx = _worker_ctx(db_session, job_try=1)
 
-        with (
-            patch("app.workers.notifications.get_db_session", return_value=db_session),
-            patch.object(db_session, "close", new_callable=AsyncMock),
-        ):
-            result = await process_scheduled_notification(ctx, str(schedule.id))
+        result = await process_scheduled_notification(ctx, str(schedule.id))
 
         assert result == {"status": "skipped", "reason": "no_channels"}
 
     @pytest.mark.asyncio
     async def test_value_error_from_ai_returns_skipped(
-        self, db_session: AsyncSession, schedule_user: User, ntfy_channel
+        self, db_session: AsyncSession, schedule_user: User, ntfy_channel, notif_mocks
     ):
         schedule = _make_due_schedule(schedule_user)
         db_session.add(schedule)
         await db_session.commit()
 
-        mock_rec_service = MagicMock()
-        mock_rec_service.generate_recommendation = AsyncMock(
-            side_effect=ValueError("not enough items")
-        )
+        notif_mocks.rec.generate_recommendation.side_effect = ValueError("not enough items")
 
-        ctx = {"job_try": 1}
-
-        with (
-            patch("app.workers.notifications.get_db_session", return_value=db_session),
-            patch.object(db_session, "close", new_callable=AsyncMock),
-            patch(
-                "app.workers.notifications.RecommendationService",
-                return_value=mock_rec_service,
-            ),
-            patch("app.services.weather_service.get_weather_service"),
-        ):
-            result = await process_scheduled_notification(ctx, str(schedule.id))
+        ctx = _worker_ctx(db_session, job_try=1)
+        result = await process_scheduled_notification(ctx, str(schedule.id))
 
         assert result["status"] == "skipped"
         assert "not enough items" in result["reason"]
 
     @pytest.mark.asyncio
     async def test_generic_exception_rolls_back_and_reraises(
-        self, db_session: AsyncSession, schedule_user: User, ntfy_channel
+        self, db_session: AsyncSession, schedule_user: User, ntfy_channel, notif_mocks
     ):
         schedule = _make_due_schedule(schedule_user)
         db_session.add(schedule)
         await db_session.commit()
 
-        mock_rec_service = MagicMock()
-        mock_rec_service.generate_recommendation = AsyncMock(
-            side_effect=RuntimeError("AI service down")
+        notif_mocks.rec.generate_recommendation.side_effect = RuntimeError("AI service down")
+
+        ctx = _worker_ctx(db_session, job_try=1)
+        with pytest.raises(RuntimeError, match="AI service down"):
+            await process_scheduled_notification(ctx, str(schedule.id))
+
+    @pytest.mark.asyncio
+    async def test_final_failure_resets_last_triggered_at(
+        self, db_session: AsyncSession, schedule_user: User, ntfy_channel, notif_mocks
+    ):
+        schedule = _make_due_schedule(schedule_user, last_triggered_at=datetime.now(UTC))
+        db_session.add(schedule)
+        await db_session.commit()
+        schedule_id = schedule.id
+
+        notif_mocks.rec.generate_recommendation.side_effect = RuntimeError("AI service down")
+
+        ctx = _worker_ctx(db_session, job_try=3)
+        with pytest.raises(RuntimeError):
+            await process_scheduled_notification(ctx, str(schedule_id))
+
+        # The worker rolled back and closed the session, so read the column afresh
+        last_triggered_at = await db_session.scalar(
+            select(Schedule.last_triggered_at).where(Schedule.id == schedule_id)
         )
+        assert last_triggered_at is None
 
-        ctx = {"job_try": 1}
 
-        with pytest.raises(RuntimeError, match="AI service down"):
-            with (
-                patch("app.workers.notifications.get_db_session", return_value=db_session),
-                patch.object(db_session, "close", new_callable=AsyncMock),
-                patch(
-                    "app.workers.notifications.RecommendationService",
-                    return_value=mock_rec_service,
-                ),
-                patch("app.services.weather_service.get_weather_service"),
-            ):
-                await process_scheduled_notification(ctx, str(schedule.id))
+# ── check_wash_reminders ──
+
+
+class TestCheckWashReminders:
+    @pytest.mark.asyncio
+    async def test_sends_once_and_records_notification(
+        self, db_session: AsyncSession, schedule_user: User, ntfy_channel
+    ):
+        db_session.add(
+            ClothingItem(
+                user_id=schedule_user.id,
+                image_path="test/shirt.jpg",
+                type="shirt",
+                name="Blue Shirt",
+                needs_wash=True,
+            )
+        )
+        await db_session.commit()
+
+        mock_provider = MagicMock()
+        mock_provider.send = AsyncMock(return_value={"success": True})
+
+        with (
+            patch("app.workers.notifications.NtfyProvider", return_value=mock_provider),
+        ):
+            first = await _check_wash_reminders_inner(_worker_ctx(db_session, app_url=APP_URL))
+            second = await _check_wash_reminders_inner(_worker_ctx(db_session, app_url=APP_URL))
+
+        assert first["notified"] >= 1
+        assert second["notified"] == 0
+        result = await db_session.execute(
+            select(Notification).where(Notification.user_id == schedule_user.id)
+        )
+        notifications = list(result.scalars().all())
+        assert len(notifications) == 1
+        assert notifications[0].channel == "ntfy"
+        assert notifications[0].payload["type"] == "wash_reminder"
+        assert notifications[0].payload["item_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_summary_lists_first_five_items(
+        self, db_session: AsyncSession, schedule_user: User, ntfy_channel
+    ):
+        db_session.add_all(
+            ClothingItem(
+                user_id=schedule_user.id,
+                image_path=f"test/item-{i}.jpg",
+                type="shirt",
+                name=f"Shirt {i}" if i % 2 else None,
+                needs_wash=True,
+            )
+            for i in range(7)
+        )
+        await db_session.commit()
+
+        mock_provider = MagicMock()
+        mock_provider.send = AsyncMock(return_value={"success": True})
+
+        with (
+            patch("app.workers.notifications.NtfyProvider", return_value=mock_provider),
+        ):
+            await _check_wash_reminders_inner(_worker_ctx(db_session, app_url=APP_URL))
+
+        result = await db_session.execute(
+            select(Notification).where(Notification.user_id == schedule_user.id)
+        )
+        payload = result.scalar_one().payload
+        assert payload["item_count"] == 7
+        assert payload["body"].startswith("7 items need washing: ")
+        assert payload["body"].endswith(" and 2 more")
+        assert payload["body"].count(", ") == 4
+
+
+# ── retry_failed_notifications ──
+
+
+@asynccontextmanager
+async def _no_lock(*args, **kwargs):
+    yield
+
+
+class TestRetryFailedNotifications:
+    @pytest.mark.asyncio
+    async def test_retrying_notification_is_sent(
+        self, db_session: AsyncSession, schedule_user: User
+    ):
+        notification = Notification(
+            user_id=schedule_user.id,
+            channel="ntfy",
+            status=NotificationStatus.retrying,
+            attempts=1,
+            payload={"title": "Today's outfit"},
+        )
+        db_session.add(notification)
+        await db_session.commit()
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.retry_notification = AsyncMock(
+            return_value=NotificationResult(channel="ntfy", status=DeliveryStatus.SENT)
+        )
+
+        with (
+            patch("app.workers.notifications.distributed_lock", _no_lock),
+            # One shared test session can't serve concurrent retries
+            patch("app.workers.notifications.RETRY_CONCURRENCY", 1),
+            patch(
+                "app.workers.notifications.NotificationDispatcher",
+                return_value=mock_dispatcher,
+            ),
+        ):
+            result = await retry_failed_notifications(
+                _worker_ctx(db_session, app_url=APP_URL, redis=_redis_mock())
+            )
+
+        assert result["retried"] >= 1
+        # The worker closed the session, detaching our instance; read the row afresh
+        retried = await db_session.get(Notification, notification.id)
+        assert retried is not notification
+        assert retried.status == NotificationStatus.sent
+        assert retried.attempts == 2
+        assert retried.sent_at is not None
+
+    @pytest.mark.asyncio
+    async def test_notification_no_longer_retrying_is_left_alone(
+        self, db_session: AsyncSession, schedule_user: User
+    ):
+        notification = Notification(
+            user_id=schedule_user.id,
+            channel="ntfy",
+            status=NotificationStatus.sent,
+            attempts=1,
+            payload={"title": "Today's outfit"},
+        )
+        db_session.add(notification)
+        await db_session.commit()
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.retry_notification = AsyncMock()
+
+        with (
+            patch("app.workers.notifications.distributed_lock", _no_lock),
+            patch(
+                "app.workers.notifications.NotificationDispatcher",
+                return_value=mock_dispatcher,
+            ),
+        ):
+            sent = await _retry_notification(
+                _worker_ctx(db_session, app_url=APP_URL), notification.id, asyncio.Semaphore(1)
+            )
+
+        assert sent is False
+        mock_dispatcher.retry_notification.assert_not_called()
+        attempts = await db_session.scalar(
+            select(Notification.attempts).where(Notification.id == notification.id)
+        )
+        assert attempts == 1
+
+
+# ── update_learning_profiles ──
+
+
+class TestUpdateLearningProfiles:
+    @pytest_asyncio.fixture
+    async def recent_feedback(self, db_session: AsyncSession, schedule_user: User) -> Outfit:
+        outfit = Outfit(
+            user_id=schedule_user.id,
+            occasion="casual",
+            scheduled_for=date.today(),
+            status=OutfitStatus.accepted,
+            responded_at=datetime.now(UTC) - timedelta(minutes=5),
+        )
+        db_session.add(outfit)
+        await db_session.commit()
+        return outfit
+
+    @pytest.mark.asyncio
+    async def test_recomputes_missing_profile(
+        self, db_session: AsyncSession, schedule_user: User, recent_feedback
+    ):
+        mock_service = MagicMock()
+        mock_service.recompute_learning_profile = AsyncMock()
+        mock_service.generate_insights = AsyncMock()
+
+        with (
+            patch("app.workers.notifications.LearningService", return_value=mock_service),
+        ):
+            result = await update_learning_profiles(_worker_ctx(db_session, redis=_redis_mock()))
+
+        assert result["updated"] >= 1
+        recomputed = [c.args[0] for c in mock_service.recompute_learning_profile.call_args_list]
+        assert schedule_user.id in recomputed
+
+    @pytest.mark.asyncio
+    async def test_skips_fresh_profile(
+        self, db_session: AsyncSession, schedule_user: User, recent_feedback
+    ):
+        db_session.add(
+            UserLearningProfile(user_id=schedule_user.id, last_computed_at=datetime.now(UTC))
+        )
+        await db_session.commit()
+
+        mock_service = MagicMock()
+        mock_service.recompute_learning_profile = AsyncMock()
+        mock_service.generate_insights = AsyncMock()
+
+        with (
+            patch("app.workers.notifications.LearningService", return_value=mock_service),
+        ):
+            await update_learning_profiles(_worker_ctx(db_session, redis=_redis_mock()))
+
+        recomputed = [c.args[0] for c in mock_service.recompute_learning_profile.call_args_list]
+        assert schedule_user.id not in recomputed
@@ -1,7 +1,10 @@
+import httpx
 import pytest
 from httpx import AsyncClient
 
 from app.models.notification import NotificationSettings
+from app.schemas.notification import NtfyConfig
+from app.services.notification_providers import NtfyNotification, NtfyProvider
 
 
 class TestNotificationSettings:
@@ -164,3 +167,30 @@ class TestNotificationDefaults:
         # Should have server and has_token fields
         assert "server" in data
         assert "has_token" in data
+
+
+class TestProviderHttpClient:
+    """Tests for providers sending through a shared HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_ntfy_uses_shared_client(self):
+        """Test that ntfy posts through the client it was given."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"id": "abc"})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as shared:
+            provider = NtfyProvider(
+                NtfyConfig(server="https://ntfy.example.com/", topic="wardrobe"), shared
+            )
+            result = await provider.send(
+                NtfyNotification(topic="", title="Hello", message="Outfit ready")
+            )
+
+        assert result["success"] is True
+        assert len(requests) == 1
+        assert str(requests[0].url) == "https://ntfy.example.com/wardrobe"
+        assert requests[0].headers["Title"] == "Hello"
+        assert requests[0].content == b"Outfit ready"
@@ -94,6 +94,11 @@ class TestListPairings:
         assert len(data["pairings"]) == 1
         assert data["pairings"][0]["source"] == "pairing"
         assert len(data["pairings"][0]["items"]) == 2
+        assert [i["id"] for i in data["pairings"][0]["items"]] == [str(item1.id), str(item2.id)]
+        assert data["pairings"][0]["items"][0]["image_url"].startswith(
+            f"/api/v1/images/{item1.image_path}?"
+        )
+        assert data["pairings"][0]["source_item"]["id"] == str(item1.id)
 
 
 class TestPairingResponseIncludesFamilyRatings:
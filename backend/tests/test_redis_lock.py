@@ -0,0 +1,153 @@
+"""Tests for the shared Redis client and distributed lock."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import fakeredis
+import pytest
+
+from app.utils import redis_lock
+from app.utils.redis_lock import close_redis, distributed_lock, get_redis
+
+
+@pytest.fixture(autouse=True)
+def reset_client(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(redis_lock, "_redis_pool", None)
+    monkeypatch.setattr(redis_lock, "_release_lock", None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeAsyncRedis:
+    # Real Lua evaluation, so the compare-and-delete release script is exercised
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(redis_lock, "_redis_pool", client)
+    monkeypatch.setattr(
+        redis_lock, "_release_lock", client.register_script(redis_lock._RELEASE_SCRIPT)
+    )
+    return client
+
+
+class _FakeClock:
+    """Stands in for the lock's time.monotonic and asyncio.sleep; sleeping advances it."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    fake = _FakeClock()
+    monkeypatch.setattr(redis_lock, "time", SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(redis_lock, "asyncio", SimpleNamespace(sleep=fake.sleep))
+    return fake
+
+
+class TestRedisClient:
+    @pytest.mark.asyncio
+    async def test_close_disconnects_pool(self):
+        client = await get_redis()
+        pool = client.connection_pool
+
+        with patch.object(pool, "disconnect", new_callable=AsyncMock) as mock_disconnect:
+            await close_redis()
+
+        mock_disconnect.assert_awaited_once()
+        assert redis_lock._redis_pool is None
+        assert await get_redis() is not client
+
+
+class TestDistributedLock:
+    @pytest.mark.asyncio
+    async def test_acquire_then_release(self, fake_redis):
+        async with distributed_lock("lock:test", timeout=10):
+            assert await fake_redis.get("lock:test") is not None
+            assert 0 < await fake_redis.pttl("lock:test") <= 10_000
+
+        assert await fake_redis.get("lock:test") is None
+
+    @pytest.mark.asyncio
+    async def test_non_blocking_attempt_times_out_while_held(self, fake_redis):
+        await fake_redis.set("lock:test", "other-holder")
+
+        with pytest.raises(TimeoutError, match="lock:test"):
+            async with distributed_lock("lock:test", blocking_timeout=0):
+                pytest.fail("lock acquired while held")
+
+        assert await fake_redis.get("lock:test") == "other-holder"
+
+    @pytest.mark.asyncio
+    async def test_blocking_wait_acquires_once_released(self, fake_redis):
+        await fake_redis.set("lock:test", "other-holder")
+
+        async def release_soon():
+            await asyncio.sleep(0.05)
+            await fake_redis.delete("lock:test")
+
+        releaser = asyncio.create_task(release_soon())
+        async with distributed_lock("lock:test", blocking_timeout=5):
+            assert await fake_redis.get("lock:test") != "other-holder"
+        await releaser
+
+    @pytest.mark.asyncio
+    async def test_blocking_wait_is_bounded_by_blocking_timeout(self, fake_redis, clock):
+        await fake_redis.set("lock:test", "other-holder")
+        start = clock.now
+
+        with pytest.raises(TimeoutError):
+            async with distributed_lock("lock:test", blocking_timeout=2):
+                pytest.fail("lock acquired while held")
+
+        assert clock.sleeps
+        assert clock.now - start == pytest.approx(2)
+
+    @pytest.mark.asyncio
+    async def test_release_keeps_key_held_under_another_token(self, fake_redis):
+        async with distributed_lock("lock:test", timeout=10):
+            # Our lease expired and another worker took the lock meanwhile
+            await fake_redis.set("lock:test", "other-holder")
+
+        assert await fake_redis.get("lock:test") == "other-holder"
+
+    @pytest.mark.asyncio
+    async def test_backoff_doubles_up_to_max_delay_and_stops_at_deadline(self, fake_redis, clock):
+        await fake_redis.set("lock:test", "other-holder")
+
+        # random() == 1.0 takes the top of the jitter range, i.e. the raw delay
+        with (
+            patch("app.utils.redis_lock.random.random", return_value=1.0),
+            pytest.raises(TimeoutError),
+        ):
+            async with distributed_lock(
+                "lock:test", blocking_timeout=5, base_delay=0.01, max_delay=1.0
+            ):
+                pytest.fail("lock acquired while held")
+
+        expected = [0.01, 0.02, 0.04, 0.08, 0.16, 0.32, 0.64, 1.0, 1.0, 1.0, 0.73]
+        assert clock.sleeps == pytest.approx(expected)
+        assert max(clock.sleeps) <= 1.0
+        assert sum(clock.sleeps) == pytest.approx(5)
+
+    @pytest.mark.asyncio
+    async def test_backoff_jitter_scales_delay_down_to_half(self, fake_redis, clock):
+        await fake_redis.set("lock:test", "other-holder")
+
+        with (
+            patch("app.utils.redis_lock.random.random", return_value=0.0),
+            pytest.raises(TimeoutError),
+        ):
+            async with distributed_lock(
+                "lock:test", blocking_timeout=1, base_delay=0.1, max_delay=0.4
+            ):
+                pytest.fail("lock acquired while held")
+
+        assert clock.sleeps[:4] == pytest.approx([0.05, 0.1, 0.2, 0.2])
+        assert sum(clock.sleeps) == pytest.approx(1)
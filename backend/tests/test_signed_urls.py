@@ -0,0 +1,51 @@
+from urllib.parse import parse_qs, urlparse
+
+from app.utils.signed_urls import sign_image_url, verify_signature
+
+IMAGE_PATH = "00000000-0000-0000-0000-000000000000/photo.jpg"
+
+
+def _split(url: str) -> tuple[str, str, str]:
+    parsed = urlparse(url)
+    params = parse_qs(parsed.query)
+    path = parsed.path.removeprefix("/api/v1/images/")
+    return path, params["expires"][0], params["sig"][0]
+
+
+class TestSignedUrls:
+    def test_round_trip(self):
+        path, expires, sig = _split(sign_image_url(IMAGE_PATH))
+        assert path == IMAGE_PATH
+        assert len(sig) == 32
+        assert verify_signature(path, expires, sig)
+
+    def test_rejects_tampered_path(self):
+        _, expires, sig = _split(sign_image_url(IMAGE_PATH))
+        assert not verify_signature("other/photo.jpg", expires, sig)
+
+    def test_rejects_tampered_signature(self):
+        path, expires, sig = _split(sign_image_url(IMAGE_PATH))
+        flipped = ("0" if sig[0] != "0" else "1") + sig[1:]
+        assert not verify_signature(path, expires, flipped)
+
+    def test_rejects_uppercase_signature(self):
+        path, expires, sig = _split(sign_image_url(IMAGE_PATH))
+        assert not verify_signature(path, expires, sig.upper())
+
+    def test_rejects_non_hex_signature(self):
+        path, expires, _ = _split(sign_image_url(IMAGE_PATH))
+        assert not verify_signature(path, expires, "z" * 32)
+        assert not verify_signature(path, expires, "é" * 32)
+
+    def test_rejects_expired(self):
+        path, expires, sig = _split(sign_image_url(IMAGE_PATH, expiry_seconds=-10))
+        assert not verify_signature(path, expires, sig)
+
+    def test_rejects_invalid_expires(self):
+        path, _, sig = _split(sign_image_url(IMAGE_PATH))
+        assert not verify_signature(path, "soon", sig)
+
+    def test_rejects_wrong_length_signature(self):
+        path, expires, sig = _split(sign_image_url(IMAGE_PATH))
+        assert not verify_signature(path, expires, sig[:-2])
+        assert not verify_signature(path, expires, sig + "00")
@@ -1,9 +1,11 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.workers.db import close_db, get_db_session, init_db
-from app.workers.tagging import shutdown, startup
+from app.workers.tagging import WorkerSettings, shutdown, startup
 
 
 class TestInitDb:
@@ -37,6 +39,26 @@ class TestInitDb:
         assert str(fake_settings.database_url) in call_kwargs.args
         assert call_kwargs.kwargs["echo"] is True
 
+    @pytest.mark.asyncio
+    async def test_uses_pool_size_from_settings(self):
+        ctx: dict = {}
+        fake_settings = MagicMock()
+        fake_settings.database_url = "postgresql+asyncpg://u:p@host/db"
+        fake_settings.db_pool_size = 7
+        fake_settings.db_max_overflow = 3
+
+        with (
+            patch("app.workers.db.get_settings", return_value=fake_settings),
+            patch("app.workers.db.create_async_engine") as mock_create,
+        ):
+            mock_create.return_value = MagicMock()
+            await init_db(ctx)
+
+        call_kwargs = mock_create.call_args.kwargs
+        assert call_kwargs["pool_size"] == 7
+        assert call_kwargs["max_overflow"] == 3
+        assert call_kwargs["pool_recycle"] == 1800
+
 
 class TestCloseDb:
     @pytest.mark.asyncio
@@ -88,43 +110,64 @@ class TestWorkerHooks:
 
         with (
             patch("app.workers.tagging.init_db", new_callable=AsyncMock) as mock_init,
+            patch("app.workers.tagging.warmup_redis", new_callable=AsyncMock) as mock_warmup,
             patch("app.workers.tagging.AIService", return_value=mock_ai),
         ):
             await startup(ctx)
 
         mock_init.assert_awaited_once_with(ctx)
+        mock_warmup.assert_awaited_once()
         assert ctx["ai_service"] is mock_ai
+        assert ctx["app_url"]
+        assert "weather_service" in ctx
+        assert ctx["http_client"] is not None
         mock_ai.check_health.assert_awaited_once()
+        await ctx["http_client"].aclose()
 
     @pytest.mark.asyncio
     async def test_shutdown_calls_close_db(self):
-        ctx = {"db_engine": MagicMock(), "db_session_factory": MagicMock()}
+        http_client = MagicMock(aclose=AsyncMock())
+        ctx = {
+            "db_engine": MagicMock(),
+            "db_session_factory": MagicMock(),
+            "http_client": http_client,
+        }
 
-        with patch("app.workers.tagging.close_db", new_callable=AsyncMock) as mock_close:
+        with (
+            patch("app.workers.tagging.close_db", new_callable=AsyncMock) as mock_close,
+            patch("app.workers.tagging.close_redis", new_callable=AsyncMock) as mock_close_redis,
+        ):
             await shutdown(ctx)
 
         mock_close.assert_awaited_once_with(ctx)
+        mock_close_redis.assert_awaited_once()
+        http_client.aclose.assert_awaited_once()
+        assert "http_client" not in ctx
+
+    def test_registers_scheduled_notification_job(self):
+        # check_scheduled_notifications enqueues onto this worker's queue
+        names = {f.__name__ for f in WorkerSettings.functions}
+        assert "process_scheduled_notification" in names
 
 
 class TestDbLifecycleRoundTrip:
     @pytest.mark.asyncio
-    async def test_init_then_get_session_then_close(self):
-        mock_engine = MagicMock()
-        mock_engine.dispose = AsyncMock()
-        mock_session = MagicMock()
-        mock_factory = MagicMock(return_value=mock_session)
+    async def test_init_then_get_session_then_close(self, async_engine):
+        # Run against the shared test engine so asyncpg's pool is really used;
+        # dispose is tracked instead of tearing down the shared pool mid-run.
         ctx: dict = {}
 
         with (
-            patch("app.workers.db.create_async_engine", return_value=mock_engine),
-            patch("app.workers.db.async_sessionmaker", return_value=mock_factory),
+            patch("app.workers.db.create_async_engine", return_value=async_engine),
+            patch.object(AsyncEngine, "dispose", new_callable=AsyncMock) as mock_dispose,
         ):
             await init_db(ctx)
 
-        assert get_db_session(ctx) is mock_session
+            async with get_db_session(ctx) as session:
+                assert await session.scalar(text("SELECT 1")) == 1
 
-        await close_db(ctx)
-        mock_engine.dispose.assert_awaited_once()
+            await close_db(ctx)
+            mock_dispose.assert_awaited_once()
 
         with pytest.raises(RuntimeError, match="not initialized"):
             get_db_session(ctx)